@@ -1,28 +1,130 @@
 """Gource command runner and process management"""
+import io
 import os
 import subprocess
 import sys
 import platform
-from typing import List, Dict, Any, Optional, Callable
+import shutil
+import shlex
+import selectors
+from typing import List, Dict, Any, Optional, Callable, IO
 import threading
 import queue
+from collections import deque
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Pipe buffer / read chunk size; large enough that chatty stderr is read in few syscalls
+PIPE_BUFSIZE = 1 << 16
+
+# Kernel buffer requested for the Gource -> FFmpeg frame pipe (Linux default is 64 KiB)
+FRAME_PIPE_SIZE = 1 << 20
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+
+# Lines of FFmpeg stderr kept for the error message when an export fails
+STDERR_TAIL_LINES = 200
+
+def enlarge_pipe_buffer(fd: int, size: int = FRAME_PIPE_SIZE) -> bool:
+    """Grow a pipe's kernel buffer so the writer can queue more data before blocking.
+    
+    Only supported on Linux; elsewhere (or if the size exceeds
+    /proc/sys/fs/pipe-max-size) the pipe is left unchanged.
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+    try:
+        fcntl.fcntl(fd, F_SETPIPE_SZ, size)
+        return True
+    except OSError:
+        return False
 
 class GourceRunner:
     """Handles running Gource with various configuration options"""
     
+    # Boolean setting -> bare command-line flag
+    FLAG_OPTIONS = (
+        ('fullscreen', '--fullscreen'),
+        ('multi_sampling', '--multi-sampling'),
+    )
+    
+    # Setting name, Gource default, command-line flag
+    VALUE_OPTIONS = (
+        ('seconds_per_day', 10.0, '--seconds-per-day'),
+        ('auto_skip_seconds', 3.0, '--auto-skip-seconds'),
+        ('font_scale', 1.0, '--font-scale'),
+        ('camera_mode', 'overview', '--camera-mode'),
+        ('elasticity', 0.0, '--elasticity'),
+        ('framerate', 60, '--output-framerate'),
+    )
+    
+    # Free-text setting -> command-line flag, passed through when non-empty
+    TEXT_OPTIONS = (
+        ('start_date', '--start-date'),
+        ('stop_date', '--stop-date'),
+    )
+    
+    # Setting name -> element name passed to --hide
+    HIDE_OPTIONS = (
+        ('hide_filenames', 'filenames'),
+        ('hide_dirnames', 'dirnames'),
+        ('hide_usernames', 'usernames'),
+        ('hide_bloom', 'bloom'),
+        ('hide_progress', 'progress'),
+    )
+    
+    # Maximum number of distinct commands kept by build_command
+    COMMAND_CACHE_SIZE = 32
+    
     def __init__(self):
         self.process = None
         self.is_running = False
+        self._gource_ok: Optional[bool] = None
+        self._ffmpeg_ok: Optional[bool] = None
+        self._command_cache: Dict[Any, tuple] = {}
+        self._probe_lock = threading.Lock()
+        
+        # Probe for Gource and FFmpeg while the UI is idle so the first run/export doesn't wait
+        threading.Thread(target=self._warm_probes, daemon=True).start()
+        
+    def _warm_probes(self) -> None:
+        """Populate the installation check caches in the background"""
+        self.check_gource_installed()
+        self._check_ffmpeg()
         
     def check_gource_installed(self) -> bool:
-        """Check if Gource is installed and accessible"""
-        try:
-            result = subprocess.run(['gource', '--help'], 
-                                  capture_output=True, 
-                                  timeout=5)
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """Check if Gource is installed and accessible (cached after first call)"""
+        if self._gource_ok is None:
+            # Callers racing the warm-up wait for its result instead of probing again
+            with self._probe_lock:
+                if self._gource_ok is None:
+                    installed = False
+                    gource_path = shutil.which('gource')
+                    if gource_path:
+                        try:
+                            # An absolute executable, no cwd and close_fds=False let Popen use
+                            # posix_spawn (vfork+exec) instead of fork(), which has to copy the
+                            # page tables of the whole GUI process. Our own fds are
+                            # non-inheritable anyway (PEP 446).
+                            # Only the exit status matters, so no pipes are set up.
+                            result = subprocess.run([gource_path, '--help'], 
+                                                  stdout=subprocess.DEVNULL, 
+                                                  stderr=subprocess.DEVNULL,
+                                                  close_fds=False,
+                                                  timeout=5)
+                            installed = result.returncode == 0
+                        except (FileNotFoundError, subprocess.TimeoutExpired):
+                            pass
+                    self._gource_ok = installed
+        return self._gource_ok
+    
+    def refresh_gource_check(self) -> bool:
+        """Forget the cached Gource detection (e.g. after the user installs it) and check again"""
+        with self._probe_lock:
+            self._gource_ok = None
+        return self.check_gource_installed()
     
     def get_installation_instructions(self) -> str:
         """Get platform-specific installation instructions for Gource"""
@@ -68,6 +170,28 @@ Option 3 - Using vcpkg:
         return instructions.get(system, 'Please visit https://gource.io for installation instructions.')
     
     def build_command(self, repo_path: str, settings: Dict[str, Any]) -> List[str]:
+        """Build Gource command from settings (memoized per repository and settings)"""
+        # --user-image-dir is only passed while the directory exists, and it can
+        # be created or removed between calls, so its existence is part of the key
+        user_image_dir = settings.get('user_image_dir', '').strip()
+        user_images_exist = bool(user_image_dir) and os.path.exists(user_image_dir)
+        try:
+            key = (repo_path, tuple(sorted(settings.items())), user_images_exist)
+            cached = self._command_cache.get(key)
+        except TypeError:
+            # Unhashable setting values - build without caching
+            return self._build_command(repo_path, settings)
+        
+        if cached is None:
+            if len(self._command_cache) >= self.COMMAND_CACHE_SIZE:
+                self._command_cache.clear()
+            cached = tuple(self._build_command(repo_path, settings))
+            self._command_cache[key] = cached
+        
+        # Callers extend the command, so always hand out a fresh list
+        return list(cached)
+    
+    def _build_command(self, repo_path: str, settings: Dict[str, Any]) -> List[str]:
         """Build Gource command from settings"""
         cmd = ['gource']
         
@@ -83,40 +207,25 @@ Option 3 - Using vcpkg:
         elif resolution != 'default':
             cmd.extend(['--viewport', resolution])
         
-        # Fullscreen
-        if settings.get('fullscreen', False):
-            cmd.append('--fullscreen')
-        
-        # Time settings
-        seconds_per_day = settings.get('seconds_per_day', 10.0)
-        if seconds_per_day != 10.0:
-            cmd.extend(['--seconds-per-day', str(seconds_per_day)])
+        # Boolean flags
+        for key, flag in self.FLAG_OPTIONS:
+            if settings.get(key, False):
+                cmd.append(flag)
         
-        auto_skip = settings.get('auto_skip_seconds', 3.0)
-        if auto_skip != 3.0:
-            cmd.extend(['--auto-skip-seconds', str(auto_skip)])
+        # Valued options, emitted only when they differ from Gource's default
+        for key, default, flag in self.VALUE_OPTIONS:
+            value = settings.get(key, default)
+            if value != default:
+                cmd.extend((flag, str(value)))
         
-        # Date range
-        start_date = settings.get('start_date', '').strip()
-        if start_date:
-            cmd.extend(['--start-date', start_date])
-        
-        stop_date = settings.get('stop_date', '').strip()
-        if stop_date:
-            cmd.extend(['--stop-date', stop_date])
+        # Free-text options such as the date range
+        for key, flag in self.TEXT_OPTIONS:
+            value = settings.get(key, '').strip()
+            if value:
+                cmd.extend((flag, value))
         
         # Hide elements
-        hide_elements = []
-        if settings.get('hide_filenames', False):
-            hide_elements.append('filenames')
-        if settings.get('hide_dirnames', False):
-            hide_elements.append('dirnames')
-        if settings.get('hide_usernames', False):
-            hide_elements.append('usernames')
-        if settings.get('hide_bloom', False):
-            hide_elements.append('bloom')
-        if settings.get('hide_progress', False):
-            hide_elements.append('progress')
+        hide_elements = [element for key, element in self.HIDE_OPTIONS if settings.get(key, False)]
         
         if hide_elements:
             cmd.extend(['--hide', ','.join(hide_elements)])
@@ -129,36 +238,38 @@ Option 3 - Using vcpkg:
                 bg_color = bg_color[1:]
             cmd.extend(['--background-colour', bg_color])
         
-        # Font scale
-        font_scale = settings.get('font_scale', 1.0)
-        if font_scale != 1.0:
-            cmd.extend(['--font-scale', str(font_scale)])
-        
-        # Camera mode
-        camera_mode = settings.get('camera_mode', 'overview')
-        if camera_mode != 'overview':
-            cmd.extend(['--camera-mode', camera_mode])
-        
         # User images
         user_image_dir = settings.get('user_image_dir', '').strip()
         if user_image_dir and os.path.exists(user_image_dir):
             cmd.extend(['--user-image-dir', user_image_dir])
         
-        # Elasticity
-        elasticity = settings.get('elasticity', 0.0)
-        if elasticity != 0.0:
-            cmd.extend(['--elasticity', str(elasticity)])
+        return cmd
+    
+    def estimate_frame_count(self, repo_path: str, settings: Dict[str, Any]) -> Optional[int]:
+        """Estimate how many frames a video export renders, or None if unknown
         
-        # Performance settings
-        if settings.get('multi_sampling', False):
-            cmd.append('--multi-sampling')
+        Gource spends seconds_per_day on each day between the first and last
+        commit; auto-skip can shorten that, so this is an upper bound.
+        """
+        git = [shutil.which('git') or 'git', '-C', repo_path]
+        try:
+            newest = subprocess.run([*git, 'log', '-1', '--all', '--format=%ct'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    close_fds=False, timeout=10).stdout.split()
+            roots = subprocess.run([*git, 'rev-list', '--max-parents=0', '--all', '--format=%ct'],
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   close_fds=False, timeout=10).stdout.split()
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
         
-        # Framerate (for video output)
-        framerate = settings.get('framerate', 60)
-        if framerate != 60:
-            cmd.extend(['--output-framerate', str(framerate)])
+        # rev-list prints "commit <sha>" before each timestamp
+        oldest = [int(token) for token in roots[2::3] if token.isdigit()]
+        if not newest or not newest[0].isdigit() or not oldest:
+            return None
         
-        return cmd
+        days = (int(newest[0]) - min(oldest)) / 86400
+        frames = int(days * settings.get('seconds_per_day', 10.0) * settings.get('framerate', 60))
+        return frames or None
     
     def run_gource(self, repo_path: str, settings: Dict[str, Any], 
                    output_callback: Optional[Callable[[str], None]] = None,
@@ -178,27 +289,27 @@ Option 3 - Using vcpkg:
         try:
             cmd = self.build_command(repo_path, settings)
             
+            # Only format the echo when someone listens; quote it so it can be pasted into a shell
             if output_callback:
-                output_callback(f"Running command: {' '.join(cmd)}")
+                output_callback(f"Running command: {shlex.join(cmd)}")
             
             # Start the process
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                bufsize=PIPE_BUFSIZE,
                 cwd=repo_path
             )
             
             self.is_running = True
             
-            # Start threads to handle output
-            if output_callback or error_callback:
-                threading.Thread(
-                    target=self._handle_process_output,
-                    args=(output_callback, error_callback),
-                    daemon=True
-                ).start()
+            # Always drain both pipes so Gource never blocks on a full pipe buffer
+            threading.Thread(
+                target=self._handle_process_output,
+                args=(output_callback, error_callback),
+                daemon=True
+            ).start()
             
             return True
             
@@ -218,6 +329,12 @@ Option 3 - Using vcpkg:
                 error_callback("Gource is not installed or not found in PATH")
             return False
         
+        # Check if ffmpeg is available for video encoding
+        if not self._check_ffmpeg():
+            if error_callback:
+                error_callback("FFmpeg is required for video export but was not found")
+            return False
+        
         try:
             cmd = self.build_command(repo_path, settings)
             
@@ -225,12 +342,6 @@ Option 3 - Using vcpkg:
             cmd.extend(['--output-ppm-stream', '-'])
             cmd.extend(['--stop-at-end'])
             
-            # Check if ffmpeg is available for video encoding
-            if not self._check_ffmpeg():
-                if error_callback:
-                    error_callback("FFmpeg is required for video export but was not found")
-                return False
-            
             # Build ffmpeg command
             ffmpeg_cmd = [
                 'ffmpeg', '-y', '-r', str(settings.get('framerate', 60)),
@@ -245,14 +356,27 @@ Option 3 - Using vcpkg:
                 progress_callback(f"Starting video export to: {output_file}")
             
             # Start both processes with pipe connection
-            gource_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=repo_path)
-            ffmpeg_process = subprocess.Popen(ffmpeg_cmd, stdin=gource_process.stdout, stderr=subprocess.PIPE)
+            gource_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                              bufsize=PIPE_BUFSIZE, cwd=repo_path)
+            enlarge_pipe_buffer(gource_process.stdout.fileno())
+            ffmpeg_process = subprocess.Popen(ffmpeg_cmd, stdin=gource_process.stdout, stderr=subprocess.PIPE,
+                                              bufsize=PIPE_BUFSIZE)
             
             gource_process.stdout.close()  # Allow gource to receive SIGPIPE if ffmpeg exits
             
+            # Drain both stderr pipes while waiting so neither process stalls
+            ffmpeg_errors = deque(maxlen=STDERR_TAIL_LINES)
+            reader = threading.Thread(
+                target=self._pump_output,
+                args=({gource_process.stderr: None, ffmpeg_process.stderr: ffmpeg_errors.append},),
+                daemon=True
+            )
+            reader.start()
+            
             # Wait for completion
             ffmpeg_process.wait()
             gource_process.wait()
+            reader.join()
             
             if ffmpeg_process.returncode == 0:
                 if progress_callback:
@@ -260,8 +384,8 @@ Option 3 - Using vcpkg:
                 return True
             else:
                 if error_callback:
-                    _, stderr = ffmpeg_process.communicate()
-                    error_callback(f"Video export failed: {stderr.decode()}")
+                    stderr = '\n'.join(ffmpeg_errors)
+                    error_callback(f"Video export failed: {stderr}")
                 return False
                 
         except Exception as e:
@@ -289,17 +413,15 @@ Option 3 - Using vcpkg:
     def _handle_process_output(self, output_callback: Optional[Callable[[str], None]], 
                               error_callback: Optional[Callable[[str], None]]) -> None:
         """Handle process output in separate thread"""
+        process = self.process
         try:
-            # Read stderr for error messages
-            while self.process and self.process.poll() is None:
-                if self.process.stderr:
-                    line = self.process.stderr.readline()
-                    if line and error_callback:
-                        error_callback(line.strip())
+            # Read stdout and stderr together until both reach EOF
+            self._pump_output({process.stdout: output_callback,
+                               process.stderr: error_callback})
             
             # Get final return code
-            if self.process:
-                return_code = self.process.poll()
+            if process:
+                return_code = process.wait()
                 if return_code == 0 and output_callback:
                     output_callback("Gource completed successfully")
                 elif return_code != 0 and error_callback:
@@ -311,12 +433,65 @@ Option 3 - Using vcpkg:
         finally:
             self.is_running = False
     
-    def _check_ffmpeg(self) -> bool:
-        """Check if FFmpeg is installed"""
+    def _pump_output(self, streams: Dict[IO[bytes], Optional[Callable[[str], None]]]) -> None:
+        """Read lines from several pipes in one thread until all of them reach EOF"""
+        streams = {stream: callback for stream, callback in streams.items() if stream}
+        
+        if os.name == 'nt':
+            # select() only works on sockets on Windows, so read each pipe on its own thread
+            threads = [threading.Thread(target=self._pump_blocking, args=item, daemon=True)
+                       for item in streams.items()]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            return
+        
+        sel = selectors.DefaultSelector()
+        tails = {}
+        for stream, callback in streams.items():
+            fd = stream.fileno()
+            os.set_blocking(fd, False)
+            sel.register(fd, selectors.EVENT_READ, callback)
+            tails[fd] = b''
+        
         try:
-            subprocess.run(['ffmpeg', '-version'], 
-                         capture_output=True, 
-                         timeout=5)
-            return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            while sel.get_map():
+                for key, _ in sel.select(timeout=0.1):
+                    try:
+                        chunk = os.read(key.fd, PIPE_BUFSIZE)
+                    except BlockingIOError:
+                        continue
+                    
+                    if not chunk:
+                        # EOF - flush any unterminated last line
+                        sel.unregister(key.fd)
+                        lines = [tails.pop(key.fd)]
+                    else:
+                        # FFmpeg ends its progress lines with '\r' alone
+                        lines = (tails[key.fd] + chunk.replace(b'\r', b'\n')).split(b'\n')
+                        tails[key.fd] = lines.pop()
+                    
+                    if key.data:
+                        for line in lines:
+                            text = line.decode('utf-8', 'replace').strip()
+                            if text:
+                                key.data(text)
+        finally:
+            sel.close()
+    
+    def _pump_blocking(self, stream: IO[bytes], callback: Optional[Callable[[str], None]]) -> None:
+        """Read lines from a single pipe until EOF"""
+        # Universal newlines also split FFmpeg's '\r'-terminated progress lines
+        text_stream = io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+        for line in iter(text_stream.readline, ''):
+            text = line.strip()
+            if text and callback:
+                callback(text)
+    
+    def _check_ffmpeg(self) -> bool:
+        """Check if FFmpeg is installed (cached after first call)"""
+        if self._ffmpeg_ok is None:
+            # Only the presence of the executable matters, so a PATH lookup is enough
+            self._ffmpeg_ok = shutil.which('ffmpeg') is not None
+        return self._ffmpeg_ok
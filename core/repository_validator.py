@@ -1,9 +1,13 @@
 """Repository validation and analysis functionality"""
 import os
+import asyncio
 import subprocess
-from datetime import datetime
+import heapq
+import time
 from typing import Optional, Dict, List, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 try:
     import git
@@ -37,6 +41,16 @@ class RepositoryValidator:
         '.bzr': 'bazaar'
     }
     
+    VCS_DIRS = frozenset(SUPPORTED_VCS)
+    
+    # Git queries shared by the sync and async analysis paths
+    GIT_WORK_TREE_ARGS = ('rev-parse', '--is-inside-work-tree')
+    GIT_HISTORY_ARGS = ('log', '--all', '--format=%an%x09%ci')
+    GIT_FILES_ARGS = ('ls-files', '-z')
+    
+    # Upper bound on git processes running at once in validate_repositories
+    MAX_CONCURRENT_GIT = 16
+    
     LANGUAGE_EXTENSIONS = {
         '.py': 'Python',
         '.js': 'JavaScript', 
@@ -74,16 +88,8 @@ class RepositoryValidator:
     
     def validate_repository(self, repo_path: str) -> RepositoryInfo:
         """Validate and analyze a repository"""
-        info = RepositoryInfo()
-        info.path = repo_path
-        info.name = os.path.basename(repo_path) if repo_path else "Unknown"
-        
-        if not repo_path or not os.path.exists(repo_path):
-            info.error_message = "Path does not exist"
-            return info
-        
-        if not os.path.isdir(repo_path):
-            info.error_message = "Path is not a directory"
+        info = self._new_repository_info(repo_path)
+        if info.error_message:
             return info
         
         # Check for version control systems
@@ -109,139 +115,269 @@ class RepositoryValidator:
             
         return info
     
+    def validate_repositories(self, repo_paths: List[str]) -> List[RepositoryInfo]:
+        """Validate and analyze several repositories concurrently
+        
+        The git queries for all repositories run as overlapping subprocesses, so
+        the total time approaches that of the slowest repository rather than the
+        sum of all of them. Git history is always read with the git command line
+        here, even when GitPython is available. Results are in input order.
+        """
+        return asyncio.run(self._validate_repositories_async(repo_paths))
+    
+    async def _validate_repositories_async(self, repo_paths: List[str]) -> List[RepositoryInfo]:
+        """Run _validate_repository_async for every path under a shared process limit"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_GIT)
+        return list(await asyncio.gather(
+            *(self._validate_repository_async(path, semaphore) for path in repo_paths)
+        ))
+    
+    async def _validate_repository_async(self, repo_path: str,
+                                         semaphore: asyncio.Semaphore) -> RepositoryInfo:
+        """Async counterpart of validate_repository"""
+        info = self._new_repository_info(repo_path)
+        if info.error_message:
+            return info
+        
+        loop = asyncio.get_running_loop()
+        
+        repo_type = self._find_vcs_dir(repo_path)
+        if not repo_type:
+            try:
+                output = await self._git_output_async(semaphore, repo_path, *self.GIT_WORK_TREE_ARGS)
+                if output is not None and output.strip() == b'true':
+                    repo_type = 'git'
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
+        
+        if not repo_type:
+            info.error_message = "No supported version control system detected"
+            return info
+        
+        info.repo_type = repo_type
+        
+        try:
+            if repo_type == 'git':
+                history, tracked = await asyncio.gather(
+                    self._git_output_async(semaphore, repo_path, *self.GIT_HISTORY_ARGS),
+                    self._git_output_async(semaphore, repo_path, *self.GIT_FILES_ARGS),
+                    return_exceptions=True
+                )
+                if isinstance(history, BaseException):
+                    raise Exception(f"Git command analysis failed: {str(history)}")
+                self._apply_git_history(info, history)
+                
+                # Tracked file list failures fall back to a tree walk, as in the sync path
+                extension_count = None
+                if isinstance(tracked, bytes):
+                    extension_count = self._count_listed_extensions(tracked)
+                await loop.run_in_executor(None, self._analyze_file_types,
+                                           repo_path, info, extension_count)
+            else:
+                await loop.run_in_executor(None, self._analyze_generic_repository, repo_path, info)
+            
+            info.is_valid = True
+            
+        except Exception as e:
+            info.error_message = f"Failed to analyze repository: {str(e)}"
+        
+        return info
+    
+    async def _git_output_async(self, semaphore: asyncio.Semaphore, repo_path: str,
+                                *args: str) -> Optional[bytes]:
+        """Async counterpart of _git_output"""
+        async with semaphore:
+            process = await asyncio.create_subprocess_exec(
+                'git', *args,
+                cwd=repo_path,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(['git', *args], 10)
+        return stdout if process.returncode == 0 else None
+    
+    def _new_repository_info(self, repo_path: str) -> RepositoryInfo:
+        """Create a RepositoryInfo for a path, with error_message set if it is unusable"""
+        info = RepositoryInfo()
+        info.path = repo_path
+        info.name = os.path.basename(repo_path) if repo_path else "Unknown"
+        
+        if not repo_path or not os.path.exists(repo_path):
+            info.error_message = "Path does not exist"
+        elif not os.path.isdir(repo_path):
+            info.error_message = "Path is not a directory"
+        
+        return info
+    
     def _detect_vcs_type(self, repo_path: str) -> Optional[str]:
         """Detect version control system type"""
-        for vcs_dir, vcs_type in self.SUPPORTED_VCS.items():
-            if os.path.exists(os.path.join(repo_path, vcs_dir)):
-                return vcs_type
+        vcs_type = self._find_vcs_dir(repo_path)
+        if vcs_type:
+            return vcs_type
         
         # Check if we're inside a git repository
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--is-inside-work-tree'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip() == 'true':
+            output = self._git_output(repo_path, *self.GIT_WORK_TREE_ARGS)
+            if output is not None and output.strip() == b'true':
                 return 'git'
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
         return None
     
+    def _find_vcs_dir(self, repo_path: str) -> Optional[str]:
+        """Detect version control system type from the top-level VCS directory"""
+        # One directory listing instead of a stat() per supported VCS
+        found = set()
+        try:
+            with os.scandir(repo_path) as entries:
+                for entry in entries:
+                    if entry.name in self.VCS_DIRS:
+                        if entry.name == '.git':
+                            return 'git'
+                        found.add(entry.name)
+        except OSError:
+            pass
+        
+        for vcs_dir, vcs_type in self.SUPPORTED_VCS.items():
+            if vcs_dir in found:
+                return vcs_type
+        
+        return None
+    
     def _analyze_git_repository(self, repo_path: str, info: RepositoryInfo) -> None:
         """Analyze Git repository using GitPython or git commands"""
-        if GITPYTHON_AVAILABLE:
-            self._analyze_git_with_gitpython(repo_path, info)
-        else:
-            self._analyze_git_with_commands(repo_path, info)
+        analyze_history = (self._analyze_git_with_gitpython if GITPYTHON_AVAILABLE
+                           else self._analyze_git_with_commands)
+        
+        # History and file types touch different parts of the repo and mostly
+        # wait on git/filesystem I/O, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            history = executor.submit(analyze_history, repo_path, info)
+            file_types = executor.submit(self._analyze_git_file_types, repo_path, info)
+            history.result()
+            file_types.result()
+    
+    def _analyze_git_file_types(self, repo_path: str, info: RepositoryInfo) -> None:
+        """Analyze file types from the Git index, falling back to a tree walk"""
+        self._analyze_file_types(repo_path, info, self._count_tracked_extensions(repo_path))
     
     def _analyze_git_with_gitpython(self, repo_path: str, info: RepositoryInfo) -> None:
         """Analyze Git repository using GitPython library"""
         try:
             repo = git.Repo(repo_path)
             
-            # Get commits
-            commits = list(repo.iter_commits())
-            info.commit_count = len(commits)
+            # Stream commits once, keeping only aggregates instead of Commit objects
+            commit_count = 0
+            contributors = set()
+            oldest = newest = None
             
-            if commits:
-                # Get contributors
-                contributors = set()
-                for commit in commits:
-                    if commit.author.name:
-                        contributors.add(commit.author.name)
+            for commit in repo.iter_commits():
+                commit_count += 1
+                
+                author_name = commit.author.name
+                if author_name:
+                    contributors.add(author_name)
                 
+                # Compare raw unix timestamps; only the two ends are ever formatted,
+                # so keep each one's offset to report it in the committer's timezone
+                committed = (commit.committed_date, commit.committer_tz_offset)
+                if oldest is None or committed[0] < oldest[0]:
+                    oldest = committed
+                if newest is None or committed[0] > newest[0]:
+                    newest = committed
+            
+            info.commit_count = commit_count
+            
+            if commit_count:
                 info.contributors = list(contributors)
                 info.contributor_count = len(contributors)
                 
-                # Get date range
-                oldest_commit = commits[-1]
-                newest_commit = commits[0]
-                
+                # Get date range; the tz offset is in seconds west of UTC
                 info.date_range = (
-                    oldest_commit.committed_datetime.strftime("%Y-%m-%d"),
-                    newest_commit.committed_datetime.strftime("%Y-%m-%d")
+                    time.strftime("%Y-%m-%d", time.gmtime(oldest[0] - oldest[1])),
+                    time.strftime("%Y-%m-%d", time.gmtime(newest[0] - newest[1]))
                 )
             
-            # Analyze file types
-            self._analyze_file_types(repo_path, info)
-            
         except Exception as e:
             raise Exception(f"GitPython analysis failed: {str(e)}")
     
     def _analyze_git_with_commands(self, repo_path: str, info: RepositoryInfo) -> None:
         """Analyze Git repository using git commands"""
         try:
-            # Get commit count
-            result = subprocess.run(
-                ['git', 'rev-list', '--count', 'HEAD'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                info.commit_count = int(result.stdout.strip())
-            
-            # Get contributors
-            result = subprocess.run(
-                ['git', 'log', '--format=%an', '--all'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                contributors = set(line.strip() for line in result.stdout.splitlines() if line.strip())
-                info.contributors = list(contributors)
-                info.contributor_count = len(contributors)
-            
-            # Get date range
-            result = subprocess.run(
-                ['git', 'log', '--format=%ci', '--reverse', '--all'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                dates = result.stdout.strip().splitlines()
-                if dates:
-                    first_date = dates[0].split()[0]
-                    last_date = dates[-1].split()[0]
-                    info.date_range = (first_date, last_date)
-            
-            # Analyze file types
-            self._analyze_file_types(repo_path, info)
+            self._apply_git_history(info, self._git_output(repo_path, *self.GIT_HISTORY_ARGS))
             
         except Exception as e:
             raise Exception(f"Git command analysis failed: {str(e)}")
     
+    def _apply_git_history(self, info: RepositoryInfo, history_output: Optional[bytes]) -> None:
+        """Fill commit count, contributors and date range from one git log pass"""
+        if history_output is None:
+            return
+        
+        # Work on raw bytes and only decode what survives deduplication
+        commit_count = 0
+        contributors = set()
+        first_date = last_date = None
+        
+        for line in history_output.split(b'\n'):
+            if not line:
+                continue
+            author, _, committed = line.partition(b'\t')
+            commit_count += 1
+            author = author.strip()
+            if author:
+                contributors.add(author)
+            
+            # ISO dates compare correctly as plain strings
+            date = committed.split(b' ', 1)[0]
+            if date:
+                if first_date is None or date < first_date:
+                    first_date = date
+                if last_date is None or date > last_date:
+                    last_date = date
+        
+        names = {name.decode('utf-8', 'replace') for name in contributors}
+        info.commit_count = commit_count
+        info.contributors = list(names)
+        info.contributor_count = len(names)
+        if first_date is not None:
+            info.date_range = (first_date.decode('ascii', 'replace'),
+                               last_date.decode('ascii', 'replace'))
+    
+    def _git_output(self, repo_path: str, *args: str) -> Optional[bytes]:
+        """Run a git command and return its raw stdout, or None if it failed"""
+        result = subprocess.run(
+            ['git', *args],
+            cwd=repo_path,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=10
+        )
+        return result.stdout if result.returncode == 0 else None
+    
     def _analyze_generic_repository(self, repo_path: str, info: RepositoryInfo) -> None:
         """Basic analysis for non-git repositories"""
         self._analyze_file_types(repo_path, info)
     
-    def _analyze_file_types(self, repo_path: str, info: RepositoryInfo) -> None:
+    def _analyze_file_types(self, repo_path: str, info: RepositoryInfo,
+                            extension_count: Optional[Counter] = None) -> None:
         """Analyze file types in the repository"""
-        extension_count = Counter()
+        if extension_count is None:
+            extension_count = Counter()
+            for name in self._iter_file_names(repo_path):
+                dot = name.rfind('.')
+                if dot > 0:
+                    extension_count[name[dot:].lower()] += 1
         
-        # Walk through directory structure
-        for root, dirs, files in os.walk(repo_path):
-            # Skip VCS directories
-            dirs[:] = [d for d in dirs if not d.startswith('.git') and not d.startswith('.svn') 
-                      and not d.startswith('.hg') and not d.startswith('.bzr')]
-            
-            for file in files:
-                if not file.startswith('.'):
-                    _, ext = os.path.splitext(file)
-                    if ext:
-                        extension_count[ext.lower()] += 1
-        
-        # Get top extensions
-        info.file_extensions = [ext for ext, _ in extension_count.most_common(10)]
+        # Get top extensions (partial selection, no full sort)
+        info.file_extensions = [ext for ext, _ in heapq.nlargest(10, extension_count.items(), key=itemgetter(1))]
         
         # Map to languages
         languages = Counter()
@@ -249,7 +385,52 @@ class RepositoryValidator:
             if ext in self.LANGUAGE_EXTENSIONS:
                 languages[self.LANGUAGE_EXTENSIONS[ext]] += count
         
-        info.primary_languages = [lang for lang, _ in languages.most_common(5)]
+        info.primary_languages = [lang for lang, _ in heapq.nlargest(5, languages.items(), key=itemgetter(1))]
+    
+    def _count_tracked_extensions(self, repo_path: str) -> Optional[Counter]:
+        """Count extensions of files tracked in the Git index, or None if git fails"""
+        try:
+            output = self._git_output(repo_path, *self.GIT_FILES_ARGS)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+        
+        if output is None:
+            return None
+        
+        return self._count_listed_extensions(output)
+    
+    def _count_listed_extensions(self, output: bytes) -> Counter:
+        """Count extensions in NUL-delimited `git ls-files -z` output"""
+        # Count raw byte extensions first so only distinct ones get decoded
+        raw_count = Counter()
+        for path in output.split(b'\0'):
+            name = path.rpartition(b'/')[2]
+            if name and not name.startswith(b'.'):
+                _, dot, ext = name.rpartition(b'.')
+                if dot:
+                    raw_count[ext] += 1
+        
+        extension_count = Counter()
+        for ext, count in raw_count.items():
+            extension_count['.' + ext.decode('utf-8', 'replace').lower()] += count
+        return extension_count
+    
+    def _iter_file_names(self, repo_path: str):
+        """Yield names of non-hidden files in the working tree, skipping VCS directories"""
+        stack = [repo_path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in self.VCS_DIRS:
+                                stack.append(entry.path)
+                        elif not name.startswith('.'):
+                            yield name
+            except OSError:
+                # Unreadable directory - skip it like os.walk does
+                continue
     
     def check_gource_compatibility(self, repo_path: str) -> Tuple[bool, str]:
         """Check if repository is compatible with Gource"""
@@ -257,7 +438,8 @@ class RepositoryValidator:
             result = subprocess.run(
                 ['gource', '--log-command', 'git'],
                 cwd=repo_path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # only stderr is reported
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=5
             )
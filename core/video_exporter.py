@@ -1,26 +1,126 @@
 """Video export functionality for Gource GUI"""
 import os
+import io
+import platform
+import re
+import selectors
+import shutil
+import signal
 import subprocess
 import threading
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Tuple, IO, Mapping
+
+# Pipe buffer size for the frame pipeline; on the order of one HD frame
+# (1920x1080x3 is ~6 MB), so each read/write syscall moves a large chunk
+FRAME_BUFSIZE = 1 << 20
+
+# Lines of FFmpeg stderr kept for the error message when an export fails
+STDERR_TAIL_LINES = 200
+
+# Playback position and frame count in FFmpeg's stats line
+# ("frame=  123 fps= 60 ... time=00:01:02.50 ...")
+_TIME_RE = re.compile(r'time=(\S+)')
+_STATS_FRAME_RE = re.compile(r'frame=\s*(\d+)')
+
+# How cancel asks FFmpeg to stop gracefully; on Windows a console break can
+# only be sent to a process started in its own process group
+if os.name == 'nt':
+    FFMPEG_INTERRUPT = signal.CTRL_BREAK_EVENT
+    FFMPEG_CREATIONFLAGS = subprocess.CREATE_NEW_PROCESS_GROUP
+else:
+    FFMPEG_INTERRUPT = signal.SIGINT
+    FFMPEG_CREATIONFLAGS = 0
 
 class VideoExporter:
     """Handles video export functionality for Gource visualizations"""
     
+    # Hardware H.264 encoders worth trying, best first, per platform
+    HW_ENCODER_CANDIDATES = {
+        'darwin': ('h264_videotoolbox',),
+        'linux': ('h264_nvenc', 'h264_qsv'),
+        'windows': ('h264_nvenc', 'h264_qsv'),
+    }
+    
+    # x264 speed preset -> closest NVENC preset
+    NVENC_PRESETS = {
+        'slow': 'p6',
+        'medium': 'p4',
+        'fast': 'p2',
+        'ultrafast': 'p1',
+    }
+    
+    # x264 speed preset -> libvpx-vp9 (deadline, cpu-used) for WebM output
+    VP9_SPEEDS = {
+        'slow': ('good', '1'),
+        'medium': ('good', '2'),
+        'fast': ('good', '4'),
+        'ultrafast': ('realtime', '8'),
+    }
+    
+    _SUPPORTED_FORMATS = MappingProxyType({
+        "MP4 (H.264)": "mp4",
+        "MOV (QuickTime)": "mov", 
+        "AVI": "avi",
+        "WebM": "webm"
+    })
+    
+    _QUALITY_PRESETS = MappingProxyType({
+        # crf doubles as the NVENC -cq / QSV -global_quality level;
+        # vt_quality is the VideoToolbox -q:v level (1-100, higher is better)
+        "Ultra High (CRF 15)": MappingProxyType({"crf": "15", "preset": "slow", "vt_quality": "80"}),
+        "High (CRF 18)": MappingProxyType({"crf": "18", "preset": "medium", "vt_quality": "70"}),
+        "Medium (CRF 23)": MappingProxyType({"crf": "23", "preset": "medium", "vt_quality": "60"}),
+        "Low (CRF 28)": MappingProxyType({"crf": "28", "preset": "fast", "vt_quality": "50"}),
+        # Quick previews while tuning settings; much faster, larger files
+        "Draft (ultrafast)": MappingProxyType({"crf": "30", "preset": "ultrafast",
+                                               "tune": "zerolatency", "vt_quality": "40"})
+    })
+    
+    # Static part of every export command: overwrite the output, and take
+    # frames as bare RGB data so FFmpeg skips the PPM demuxer entirely
+    _FFMPEG_BASE_ARGS = ('-y', '-f', 'rawvideo', '-pixel_format', 'rgb24')
+    
     def __init__(self):
         self.is_exporting = False
         self.current_process = None
+        self._export_lock = threading.Lock()
+        self._video_encoder: Optional[str] = None
+        self._ffmpeg_ok: Optional[bool] = None
+        self._ffmpeg_path: Optional[str] = None
         
     def check_ffmpeg_installed(self) -> bool:
-        """Check if FFmpeg is installed and accessible"""
+        """Check if FFmpeg is on PATH (cached after the first check)
+        
+        This is a PATH lookup only; use verify_ffmpeg_runs() to actually launch it.
+        """
+        if self._ffmpeg_ok is None:
+            self._ffmpeg_path = shutil.which('ffmpeg')
+            self._ffmpeg_ok = self._ffmpeg_path is not None
+        return self._ffmpeg_ok
+    
+    def verify_ffmpeg_runs(self) -> bool:
+        """Check that FFmpeg is installed and actually starts"""
+        if not self.check_ffmpeg_installed():
+            return False
         try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, 
+            # Only the exit status matters, so no pipes are set up
+            result = subprocess.run([self._ffmpeg_path, '-version'], 
+                                  stdout=subprocess.DEVNULL, 
+                                  stderr=subprocess.DEVNULL,
+                                  close_fds=False,
                                   timeout=5)
             return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        except (OSError, subprocess.TimeoutExpired):
             return False
     
+    def refresh_ffmpeg_check(self) -> bool:
+        """Forget cached FFmpeg detection (e.g. after the user installs it) and check again"""
+        self._ffmpeg_ok = None
+        self._video_encoder = None
+        return self.check_ffmpeg_installed()
+    
     def get_ffmpeg_installation_instructions(self) -> str:
         """Get platform-specific FFmpeg installation instructions"""
         return """To install FFmpeg:
@@ -40,23 +140,13 @@ Windows:
 
 FFmpeg is required for video export functionality."""
     
-    def get_supported_formats(self) -> Dict[str, str]:
-        """Get supported video formats"""
-        return {
-            "MP4 (H.264)": "mp4",
-            "MOV (QuickTime)": "mov", 
-            "AVI": "avi",
-            "WebM": "webm"
-        }
-    
-    def get_quality_presets(self) -> Dict[str, Dict[str, Any]]:
-        """Get quality presets for video export"""
-        return {
-            "Ultra High (CRF 15)": {"crf": "15", "preset": "slow"},
-            "High (CRF 18)": {"crf": "18", "preset": "medium"},
-            "Medium (CRF 23)": {"crf": "23", "preset": "medium"},
-            "Low (CRF 28)": {"crf": "28", "preset": "fast"}
-        }
+    def get_supported_formats(self) -> Mapping[str, str]:
+        """Get supported video formats (read-only)"""
+        return self._SUPPORTED_FORMATS
+    
+    def get_quality_presets(self) -> Mapping[str, Mapping[str, str]]:
+        """Get quality presets for video export (read-only)"""
+        return self._QUALITY_PRESETS
     
     def export_video(self, 
                     gource_command: list,
@@ -65,27 +155,41 @@ FFmpeg is required for video export functionality."""
                     framerate: int = 60,
                     progress_callback: Optional[Callable[[str], None]] = None,
                     error_callback: Optional[Callable[[str], None]] = None,
-                    completion_callback: Optional[Callable[[bool, str], None]] = None) -> bool:
-        """Export Gource visualization to video file"""
+                    completion_callback: Optional[Callable[[bool, str], None]] = None,
+                    hardware_encoding: bool = True) -> bool:
+        """Export Gource visualization to video file
         
-        if self.is_exporting:
-            if error_callback:
-                error_callback("Video export already in progress")
-            return False
+        With hardware_encoding, a working GPU/media-engine H.264 encoder is used
+        when one is available; otherwise (or if disabled) libx264 encodes on the CPU.
+        """
         
         if not self.check_ffmpeg_installed():
             if error_callback:
                 error_callback("FFmpeg is not installed. " + self.get_ffmpeg_installation_instructions())
             return False
         
+        # Test-and-set atomically, so two quick clicks can't start two exports
+        with self._export_lock:
+            already_exporting = self.is_exporting
+            self.is_exporting = True
+        
+        if already_exporting:
+            if error_callback:
+                error_callback("Video export already in progress")
+            return False
+        
         # Start export in background thread
         export_thread = threading.Thread(
             target=self._export_video_thread,
             args=(gource_command, output_path, quality_preset, framerate, 
-                  progress_callback, error_callback, completion_callback),
+                  progress_callback, error_callback, completion_callback, hardware_encoding),
             daemon=True
         )
-        export_thread.start()
+        try:
+            export_thread.start()
+        except RuntimeError:
+            self.is_exporting = False
+            raise
         
         return True
     
@@ -96,11 +200,10 @@ FFmpeg is required for video export functionality."""
                            framerate: int,
                            progress_callback: Optional[Callable[[str], None]],
                            error_callback: Optional[Callable[[str], None]],
-                           completion_callback: Optional[Callable[[bool, str], None]]):
+                           completion_callback: Optional[Callable[[bool, str], None]],
+                           hardware_encoding: bool = True):
         """Export video in background thread"""
         
-        self.is_exporting = True
-        
         try:
             if progress_callback:
                 progress_callback("Starting video export...")
@@ -108,28 +211,21 @@ FFmpeg is required for video export functionality."""
             # Get quality settings
             quality_presets = self.get_quality_presets()
             quality_settings = quality_presets.get(quality_preset, quality_presets["High (CRF 18)"])
+            if output_path.lower().endswith('.webm'):
+                encoder = 'libvpx-vp9'  # WebM cannot carry H.264
+            elif hardware_encoding:
+                encoder = self.get_video_encoder()
+            else:
+                encoder = 'libx264'
             
             # Modify Gource command for video export
-            gource_cmd = gource_command.copy()
-            gource_cmd.extend([
+            gource_executable, *gource_args = gource_command
+            gource_cmd = (
+                shutil.which(gource_executable) or gource_executable,
+                *gource_args,
                 '--output-ppm-stream', '-',
                 '--stop-at-end'
-            ])
-            
-            # Build FFmpeg command
-            ffmpeg_cmd = [
-                'ffmpeg', '-y',  # Overwrite output file
-                '-r', str(framerate),  # Input framerate
-                '-f', 'image2pipe',
-                '-vcodec', 'ppm',
-                '-i', '-',  # Read from stdin
-                '-vcodec', 'libx264',
-                '-preset', quality_settings['preset'],
-                '-crf', quality_settings['crf'],
-                '-pix_fmt', 'yuv420p',
-                '-movflags', 'faststart',
-                output_path
-            ]
+            )
             
             if progress_callback:
                 progress_callback("Launching Gource and FFmpeg...")
@@ -139,37 +235,115 @@ FFmpeg is required for video export functionality."""
                 gource_cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=False  # Binary mode for PPM stream
+                text=False,  # Binary mode for PPM stream
+                bufsize=FRAME_BUFSIZE,
+                close_fds=False
             )
+            self.current_process = (gource_process, None)
+            ffmpeg_process = None
+            progress_fd = None
             
-            # Start FFmpeg process
-            ffmpeg_process = subprocess.Popen(
-                ffmpeg_cmd,
-                stdin=gource_process.stdout,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Close Gource stdout in parent process
-            gource_process.stdout.close()
-            
-            # Store processes for potential cancellation
-            self.current_process = (gource_process, ffmpeg_process)
-            
-            if progress_callback:
-                progress_callback("Rendering video... This may take several minutes.")
+            try:
+                # The first frame header tells us the size Gource actually renders at
+                first_header = self._read_ppm_header(gource_process.stdout)
+                if first_header is None:
+                    _, gource_stderr = gource_process.communicate()
+                    gource_stderr = gource_stderr.decode('utf-8', 'replace').strip()
+                    raise RuntimeError(f"Gource produced no video frames. {gource_stderr}".strip())
+                header, width, height = first_header
+                
+                # Progress arrives as key=value records on a dedicated pipe; Windows
+                # cannot pass extra fds, so it falls back to scraping stderr
+                progress_args = ()
+                pass_fds = ()
+                if os.name != 'nt':
+                    progress_fd, progress_write_fd = os.pipe()
+                    progress_args = ('-nostats', '-progress', f'pipe:{progress_write_fd}')
+                    pass_fds = (progress_write_fd,)
+                
+                # faststart moves the index up front in a second pass; only the
+                # MP4-family containers have one to move
+                container_args = ()
+                if output_path.lower().endswith(('.mp4', '.mov', '.m4v')):
+                    container_args = ('-movflags', 'faststart')
+                
+                # Build FFmpeg command
+                ffmpeg_cmd = (
+                    self._ffmpeg_executable(),
+                    *self._FFMPEG_BASE_ARGS,
+                    *progress_args,
+                    '-video_size', f'{width}x{height}',
+                    '-framerate', str(framerate),  # Input framerate
+                    '-i', '-',  # Read from stdin
+                    *self._encoder_args(encoder, quality_settings),
+                    *container_args,
+                    output_path
+                )
+                
+                # Start FFmpeg process
+                try:
+                    ffmpeg_process = subprocess.Popen(
+                        ffmpeg_cmd,
+                        stdin=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        bufsize=FRAME_BUFSIZE,
+                        pass_fds=pass_fds,
+                        creationflags=FFMPEG_CREATIONFLAGS
+                    )
+                finally:
+                    # Only FFmpeg holds the write end, so the pipe hits EOF when it exits
+                    for fd in pass_fds:
+                        os.close(fd)
+                # Universal newlines turn FFmpeg's '\r'-terminated stats into lines
+                ffmpeg_stderr = io.TextIOWrapper(ffmpeg_process.stderr, encoding='utf-8', errors='replace')
+                
+                # Store processes for potential cancellation
+                self.current_process = (gource_process, ffmpeg_process)
+                
+                if progress_callback:
+                    progress_callback(f"Rendering video with {encoder}... This may take several minutes.")
+                
+                # Drain FFmpeg stderr so it never blocks on a full pipe
+                stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+                ffmpeg_stderr_thread = threading.Thread(
+                    target=self._monitor_ffmpeg_stderr,
+                    args=(ffmpeg_stderr, stderr_tail,
+                          progress_callback if progress_fd is None else None),
+                    daemon=True
+                )
+                ffmpeg_stderr_thread.start()
+                
+                progress_thread = None
+                if progress_fd is not None:
+                    progress_thread = threading.Thread(
+                        target=self._monitor_ffmpeg_progress,
+                        args=(progress_fd, progress_callback),
+                        daemon=True
+                    )
+                    progress_thread.start()
+            except BaseException:
+                # Don't leave Gource blocked on a full pipe with its window open
+                if progress_fd is not None:
+                    os.close(progress_fd)
+                gource_process.stdout.close()
+                if ffmpeg_process:
+                    ffmpeg_process.stdin.close()
+                for process in (gource_process, ffmpeg_process):
+                    if process:
+                        process.terminate()
+                        self._wait_or_kill(process, timeout=2)
+                        process.stderr.close()
+                raise
             
-            # Monitor FFmpeg stderr for progress (optional)
-            ffmpeg_stderr_thread = threading.Thread(
-                target=self._monitor_ffmpeg_progress,
-                args=(ffmpeg_process, progress_callback),
-                daemon=True
-            )
-            ffmpeg_stderr_thread.start()
+            # Strip the per-frame headers and hand the pixel data to FFmpeg
+            self._relay_frames(gource_process.stdout, ffmpeg_process.stdin,
+                               header, width * height * 3)
             
             # Wait for both processes to complete
             gource_return_code = gource_process.wait()
             ffmpeg_return_code = ffmpeg_process.wait()
+            if progress_thread:
+                progress_thread.join()  # No progress reports after the final status
             
             # Check results
             if ffmpeg_return_code == 0:
@@ -178,9 +352,10 @@ FFmpeg is required for video export functionality."""
                 if completion_callback:
                     completion_callback(True, f"Video exported to: {output_path}")
             else:
-                # Get FFmpeg error output
-                _, ffmpeg_stderr = ffmpeg_process.communicate()
-                error_msg = f"FFmpeg failed with code {ffmpeg_return_code}: {ffmpeg_stderr}"
+                # Report the tail of FFmpeg's output once the monitor has reached EOF
+                ffmpeg_stderr_thread.join()
+                ffmpeg_output = '\n'.join(stderr_tail)
+                error_msg = f"FFmpeg failed with code {ffmpeg_return_code}: {ffmpeg_output}"
                 
                 if error_callback:
                     error_callback(error_msg)
@@ -198,54 +373,333 @@ FFmpeg is required for video export functionality."""
             self.is_exporting = False
             self.current_process = None
     
-    def _monitor_ffmpeg_progress(self, 
-                               ffmpeg_process: subprocess.Popen,
+    def _ffmpeg_executable(self) -> str:
+        """Get the absolute FFmpeg path, so Popen can use posix_spawn (vfork+exec)
+        
+        posix_spawn is only used for an absolute executable with no cwd,
+        close_fds=False and no pass_fds; our own fds are non-inheritable
+        anyway (PEP 446). It spares fork() copying the GUI's page tables.
+        """
+        if self._ffmpeg_path is None:
+            self._ffmpeg_path = shutil.which('ffmpeg')
+        return self._ffmpeg_path or 'ffmpeg'
+    
+    def get_video_encoder(self) -> str:
+        """Get the H.264 encoder to export with, preferring a working hardware encoder
+        
+        Detection runs once per exporter; encoders that FFmpeg lists but cannot
+        open (e.g. NVENC without an NVIDIA GPU) are skipped via a one-frame test.
+        """
+        if self._video_encoder is None:
+            self._video_encoder = 'libx264'
+            candidates = self.HW_ENCODER_CANDIDATES.get(platform.system().lower(), ())
+            try:
+                listed = subprocess.run([self._ffmpeg_executable(), '-hide_banner', '-encoders'],
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                        text=True, close_fds=False, timeout=5).stdout
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                listed = ''
+            
+            for candidate in candidates:
+                if candidate in listed and self._encoder_works(candidate):
+                    self._video_encoder = candidate
+                    break
+        
+        return self._video_encoder
+    
+    def _encoder_works(self, encoder: str) -> bool:
+        """Check that FFmpeg can actually encode a frame with the given encoder"""
+        try:
+            result = subprocess.run(
+                [self._ffmpeg_executable(), '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+                 '-frames:v', '1', '-vcodec', encoder, '-f', 'null', '-'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+                timeout=10
+            )
+            return result.returncode == 0
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return False
+    
+    def _encoder_args(self, encoder: str, quality_settings: Mapping[str, str]) -> list:
+        """Get FFmpeg output codec and quality arguments for an encoder"""
+        if encoder == 'h264_nvenc':
+            return ['-vcodec', encoder,
+                    '-preset', self.NVENC_PRESETS.get(quality_settings['preset'], 'p4'),
+                    '-rc', 'vbr', '-cq', quality_settings['crf'], '-b:v', '0',
+                    '-pix_fmt', 'yuv420p']
+        if encoder == 'h264_qsv':
+            return ['-vcodec', encoder,
+                    '-global_quality', quality_settings['crf'],
+                    '-pix_fmt', 'nv12']
+        if encoder == 'h264_videotoolbox':
+            return ['-vcodec', encoder,
+                    '-q:v', quality_settings['vt_quality'],
+                    '-pix_fmt', 'yuv420p']
+        if encoder == 'libvpx-vp9':
+            deadline, cpu_used = self.VP9_SPEEDS.get(quality_settings['preset'], ('good', '2'))
+            return ['-vcodec', encoder,
+                    '-crf', quality_settings['crf'], '-b:v', '0',
+                    '-deadline', deadline, '-cpu-used', cpu_used,
+                    '-row-mt', '1', '-threads', '0',
+                    '-pix_fmt', 'yuv420p']
+        
+        args = ['-vcodec', 'libx264',
+                '-preset', quality_settings['preset']]
+        if quality_settings['preset'] in ('slow', 'medium'):
+            # Frame threads rather than slices, for throughput on every core;
+            # the faster presets are left as x264 tunes them
+            args += ['-x264-params', 'threads=auto:sliced-threads=0',
+                     '-filter_threads', str(os.cpu_count() or 1)]
+        args += ['-crf', quality_settings['crf']]
+        if 'tune' in quality_settings:
+            args += ['-tune', quality_settings['tune']]
+        return args + ['-threads', '0', '-pix_fmt', 'yuv420p']
+    
+    def _read_ppm_header(self, stream: IO[bytes]) -> Optional[Tuple[bytes, int, int]]:
+        """Read one binary PPM header, returning (raw header, width, height) or None at EOF"""
+        header = bytearray()
+        token = bytearray()
+        fields = []
+        # Read the fd directly so nothing past the header sits in the stream's
+        # buffer, where a later splice() would not see it
+        fd = stream.fileno()
+        
+        # "P6 <width> <height> <maxval>" followed by exactly one whitespace byte
+        while len(fields) < 4:
+            byte = os.read(fd, 1)
+            if not byte:
+                return None
+            header += byte
+            if byte.isspace():
+                if token:
+                    fields.append(bytes(token))
+                    token.clear()
+            else:
+                token += byte
+        
+        magic, width, height, maxval = fields
+        if magic != b'P6' or maxval != b'255':
+            raise RuntimeError(f"Unsupported PPM stream from Gource: {bytes(header)!r}")
+        
+        return bytes(header), int(width), int(height)
+    
+    def _relay_frames(self, source: IO[bytes], sink: IO[bytes], header: bytes, frame_size: int):
+        """Copy frame pixel data from Gource's PPM stream to FFmpeg, dropping the headers"""
+        try:
+            if hasattr(os, 'splice'):
+                # Linux: move pixel data pipe-to-pipe inside the kernel
+                self._splice_frames(source.fileno(), sink.fileno(), header, frame_size)
+            else:
+                self._copy_frames(source.fileno(), sink.fileno(), header, frame_size)
+        except BrokenPipeError:
+            pass  # FFmpeg exited early; its return code reports why
+        finally:
+            # Closing our end lets FFmpeg finish, and makes Gource get SIGPIPE if still writing
+            source.close()
+            try:
+                sink.close()
+            except BrokenPipeError:
+                pass
+    
+    def _copy_frames(self, source_fd: int, sink_fd: int, header: bytes, frame_size: int):
+        """Relay frames through user space with unbuffered reads and writes on the fds"""
+        # Gource writes the same header before every frame, so after the first one
+        # each frame plus the next header is one fixed-size read into a reused buffer
+        buffer = bytearray(frame_size + len(header))
+        view = memoryview(buffer)
+        frame, next_header = view[:frame_size], view[frame_size:]
+        while True:
+            filled = self._readinto_exact(source_fd, view)
+            if filled < frame_size:
+                break  # EOF (a truncated last frame is dropped)
+            self._write_all(sink_fd, frame)
+            
+            if filled == frame_size:
+                break
+            if next_header != header:
+                raise RuntimeError("Unexpected frame header in Gource PPM stream")
+    
+    def _readinto_exact(self, fd: int, view: memoryview) -> int:
+        """Fill view from fd, stopping early only at EOF; returns the bytes read"""
+        filled = 0
+        while filled < len(view):
+            if hasattr(os, 'readv'):
+                count = os.readv(fd, [view[filled:]])
+            else:
+                # Windows has no readv, so the data takes one extra copy
+                chunk = os.read(fd, len(view) - filled)
+                count = len(chunk)
+                view[filled:filled + count] = chunk
+            if not count:
+                break
+            filled += count
+        return filled
+    
+    def _write_all(self, fd: int, view: memoryview):
+        """Write all of view to fd"""
+        while view:
+            view = view[os.write(fd, view):]
+    
+    def _splice_frames(self, source_fd: int, sink_fd: int, header: bytes, frame_size: int):
+        """Relay frames with splice(2), so pixel data is never copied into Python"""
+        header_size = len(header)
+        while True:
+            remaining = frame_size
+            while remaining:
+                moved = os.splice(source_fd, sink_fd, remaining, flags=os.SPLICE_F_MOVE)
+                if not moved:
+                    return  # EOF (FFmpeg's rawvideo demuxer drops a truncated last frame)
+                remaining -= moved
+            
+            next_header = self._read_exact(source_fd, header_size)
+            if not next_header:
+                return
+            if next_header != header:
+                raise RuntimeError("Unexpected frame header in Gource PPM stream")
+    
+    def _read_exact(self, fd: int, size: int) -> bytes:
+        """Read up to size bytes from fd, stopping early only at EOF"""
+        data = b''
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    
+    def _monitor_ffmpeg_progress(self,
+                               progress_fd: int,
                                progress_callback: Optional[Callable[[str], None]]):
-        """Monitor FFmpeg stderr for progress information"""
-        if not progress_callback or not ffmpeg_process.stderr:
-            return
+        """Report progress from FFmpeg's -progress records until the pipe closes"""
+        selector = selectors.DefaultSelector()
+        selector.register(progress_fd, selectors.EVENT_READ)
+        record = {}
+        pending = b''
         
         try:
-            while ffmpeg_process.poll() is None:
-                line = ffmpeg_process.stderr.readline()
-                if line:
-                    # Look for time information in FFmpeg output
-                    if "time=" in line:
-                        # Extract time information
-                        time_part = line.split("time=")[1].split()[0]
-                        progress_callback(f"Rendering... Time: {time_part}")
+            while True:
+                selector.select()
+                chunk = os.read(progress_fd, 4096)
+                if not chunk:
+                    return
+                
+                *lines, pending = (pending + chunk).split(b'\n')
+                for line in lines:
+                    key, _, value = line.decode('ascii', 'replace').strip().partition('=')
+                    if key != 'progress':
+                        record[key] = value
+                        continue
+                    
+                    # "progress=continue|end" closes each record
+                    if progress_callback:
+                        progress_callback(self._format_progress(record))
+                    record.clear()
+        except Exception:
+            # Ignore errors in progress monitoring
+            pass
+        finally:
+            selector.close()
+            os.close(progress_fd)
+    
+    def _format_progress(self, record: Dict[str, str]) -> str:
+        """Turn one FFmpeg -progress record into a status message"""
+        # Despite its name, out_time_ms is in microseconds
+        out_time_us = record.get('out_time_us', record.get('out_time_ms', ''))
+        if not out_time_us.isdigit():
+            return "Rendering..."
+        
+        minutes, seconds = divmod(int(out_time_us) / 1_000_000, 60)
+        hours, minutes = divmod(int(minutes), 60)
+        message = f"Rendering... Time: {hours:02d}:{minutes:02d}:{seconds:05.2f}"
+        if record.get('frame', '').isdigit():
+            message += f" (frame {record['frame']})"
+        return message
+    
+    def _monitor_ffmpeg_stderr(self, 
+                             stderr: IO[str],
+                             tail: deque,
+                             progress_callback: Optional[Callable[[str], None]]):
+        """Drain FFmpeg stderr into a bounded tail, scraping progress if a callback is given"""
+        try:
+            # readline() blocks until data or EOF, so no poll() per line is needed
+            for line in iter(stderr.readline, ''):
+                # Look for time information in FFmpeg output
+                match = _TIME_RE.search(line)
+                if match:
+                    if progress_callback:
+                        message = f"Rendering... Time: {match.group(1)}"
+                        # Same "(frame N)" suffix as _format_progress, for the progress bar
+                        frame = _STATS_FRAME_RE.search(line)
+                        if frame:
+                            message += f" (frame {frame.group(1)})"
+                        progress_callback(message)
+                elif line.strip():
+                    # Stats lines are left out so they can't push errors out of the tail
+                    tail.append(line.rstrip())
         except Exception:
             # Ignore errors in progress monitoring
             pass
     
     def cancel_export(self) -> bool:
-        """Cancel ongoing video export"""
+        """Cancel ongoing video export
+        
+        Returns as soon as FFmpeg has been asked to stop; the export thread
+        reports completion once both processes have exited.
+        """
         if not self.is_exporting or not self.current_process:
             return False
         
         try:
             gource_process, ffmpeg_process = self.current_process
             
-            # Terminate processes
-            if gource_process and gource_process.poll() is None:
-                gource_process.terminate()
-            
+            # Interrupt FFmpeg first so it finalizes the container (e.g. the MP4
+            # moov atom) and the video rendered so far stays playable
             if ffmpeg_process and ffmpeg_process.poll() is None:
-                ffmpeg_process.terminate()
+                try:
+                    ffmpeg_process.send_signal(FFMPEG_INTERRUPT)
+                except OSError:
+                    pass  # The stop thread falls through to terminate/kill
             
-            # Wait a bit and force kill if necessary
-            import time
-            time.sleep(2)
-            
-            if gource_process and gource_process.poll() is None:
-                gource_process.kill()
-                
-            if ffmpeg_process and ffmpeg_process.poll() is None:
-                ffmpeg_process.kill()
-            
-            self.is_exporting = False
-            self.current_process = None
+            # Waiting for FFmpeg to flush can take seconds, so keep it off the caller's thread
+            threading.Thread(
+                target=self._stop_processes,
+                args=(gource_process, ffmpeg_process),
+                daemon=True
+            ).start()
             return True
             
         except Exception:
             return False
+    
+    def _stop_processes(self, gource_process: subprocess.Popen,
+                        ffmpeg_process: Optional[subprocess.Popen]):
+        """Let an interrupted FFmpeg finish, then terminate whatever is still running"""
+        if ffmpeg_process:
+            try:
+                ffmpeg_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass  # Fall through to terminate/kill
+        
+        # Terminate processes
+        for process in (gource_process, ffmpeg_process):
+            if process and process.poll() is None:
+                try:
+                    process.terminate()
+                except OSError:
+                    pass
+        
+        # Give each a moment to exit and force kill only if it doesn't
+        for process in (gource_process, ffmpeg_process):
+            if process:
+                self._wait_or_kill(process, timeout=2)
+    
+    def _wait_or_kill(self, process: subprocess.Popen, timeout: float):
+        """Wait up to timeout seconds for a process to exit, killing it if it doesn't"""
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
@@ -5,8 +5,16 @@ This script demonstrates the functionality without requiring user interaction
 """
 import os
 import sys
+import shutil
 import subprocess
 import tempfile
+import time
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -14,37 +22,76 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.gource_runner import GourceRunner
 from core.repository_validator import RepositoryValidator
 
+# Files committed to the sample repository, one commit each
+SAMPLE_FILES = [
+    ('README.md', '# Demo Project\n\nThis is a demonstration repository for Gource GUI.'),
+    ('src/main.py', 'print("Hello, Gource!")'),
+    ('src/utils.py', 'def greet(name):\n    return f"Hello, {name}!"'),
+    ('docs/guide.md', '# User Guide\n\nHow to use this project.'),
+    ('tests/test_main.py', 'import unittest\n\nclass TestMain(unittest.TestCase):\n    pass')
+]
+
 def create_sample_repo():
     """Create a sample git repository for testing"""
     temp_dir = tempfile.mkdtemp(prefix="gource_demo_")
     
     print(f"Creating sample repository in: {temp_dir}")
     
-    # Initialize git repo
-    subprocess.run(['git', 'init'], cwd=temp_dir, capture_output=True)
-    subprocess.run(['git', 'config', 'user.name', 'Demo User'], cwd=temp_dir, capture_output=True)
-    subprocess.run(['git', 'config', 'user.email', 'demo@example.com'], cwd=temp_dir, capture_output=True)
-    
-    # Create some files and commits
-    files_to_create = [
-        ('README.md', '# Demo Project\n\nThis is a demonstration repository for Gource GUI.'),
-        ('src/main.py', 'print("Hello, Gource!")'),
-        ('src/utils.py', 'def greet(name):\n    return f"Hello, {name}!"'),
-        ('docs/guide.md', '# User Guide\n\nHow to use this project.'),
-        ('tests/test_main.py', 'import unittest\n\nclass TestMain(unittest.TestCase):\n    pass')
-    ]
+    if PYGIT2_AVAILABLE:
+        _create_commits_pygit2(temp_dir, SAMPLE_FILES)
+    else:
+        _create_commits_git(temp_dir, SAMPLE_FILES)
     
-    for i, (filepath, content) in enumerate(files_to_create):
-        full_path = os.path.join(temp_dir, filepath)
+    return temp_dir
+
+def _create_commits_pygit2(repo_dir, files_to_create):
+    """Initialize the repository and commit each file in-process with libgit2"""
+    repo = pygit2.init_repository(repo_dir)
+    signature = pygit2.Signature('Demo User', 'demo@example.com', int(time.time()), 0)
+    
+    parents = []
+    for filepath, content in files_to_create:
+        full_path = os.path.join(repo_dir, filepath)
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        
-        with open(full_path, 'w') as f:
+        with open(full_path, 'w', encoding='utf-8') as f:
             f.write(content)
         
-        subprocess.run(['git', 'add', filepath], cwd=temp_dir, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', f'Add {filepath}'], cwd=temp_dir, capture_output=True)
+        repo.index.add(filepath)
+        repo.index.write()
+        commit = repo.create_commit('HEAD', signature, signature, f'Add {filepath}',
+                                    repo.index.write_tree(), parents)
+        parents = [commit]
+
+def _create_commits_git(repo_dir, files_to_create):
+    """Initialize the repository and commit each file with the git command line"""
+    # An absolute git path, `-C` instead of cwd= and close_fds=False let
+    # subprocess use posix_spawn rather than fork+exec
+    git = [shutil.which('git') or 'git', '-C', repo_dir]
     
-    return temp_dir
+    # Initialize git repo
+    subprocess.run([*git, 'init'], capture_output=True, close_fds=False)
+    
+    # Write every commit as one fast-import stream instead of running
+    # add + commit per file, then check the result out in one go
+    with open(os.path.join(repo_dir, '.git', 'HEAD')) as f:
+        branch = f.read().split('ref:', 1)[-1].strip()
+    committer = f"Demo User <demo@example.com> {int(time.time())} +0000"
+    
+    stream = []
+    for i, (filepath, content) in enumerate(files_to_create, start=1):
+        data = content.encode('utf-8')
+        message = f'Add {filepath}'.encode('utf-8')
+        stream += [
+            b'blob', b'mark :%d' % i, b'data %d' % len(data), data,
+            f'commit {branch}'.encode('utf-8'), f'committer {committer}'.encode('utf-8'),
+            b'data %d' % len(message), message,
+            b'M 100644 :%d ' % i + filepath.encode('utf-8'),
+            b''
+        ]
+    
+    subprocess.run([*git, 'fast-import', '--quiet'], input=b'\n'.join(stream),
+                   capture_output=True, close_fds=False)
+    subprocess.run([*git, 'reset', '--hard', '--quiet'], capture_output=True, close_fds=False)
 
 def test_repository_validation(repo_path):
     """Test repository validation functionality"""
@@ -2,6 +2,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+import subprocess
+import threading
 from typing import Optional
 
 class GourceGUIApp:
@@ -111,12 +113,32 @@ class GourceGUIApp:
         # Show command and run
         command_str = " ".join(cmd)
         self.status_bar.config(text=f"Running: {command_str}")
-        
+        self.run_button.config(state=tk.DISABLED)
+        
+        # Popen can take tens of milliseconds (fork/exec), so keep it off the Tk thread
+        threading.Thread(
+            target=self._launch_gource,
+            args=(cmd, self.current_repo_path),
+            daemon=True
+        ).start()
+    
+    def _launch_gource(self, cmd, repo_path):
+        """Start Gource in a worker thread and report back on the Tk thread"""
         try:
-            import subprocess
-            subprocess.Popen(cmd, cwd=self.current_repo_path)
-            messagebox.showinfo("Success", "Gource started successfully!")
+            # Nothing reads Gource's console output, so don't give it pipes to fill
+            subprocess.Popen(cmd, cwd=repo_path,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            error = None
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to run Gource:\n{str(e)}")
+            error = str(e)
+        self.root.after(0, self._on_gource_launched, error)
+    
+    def _on_gource_launched(self, error: Optional[str]):
+        """Show the outcome of starting Gource"""
+        if error is None:
+            messagebox.showinfo("Success", "Gource started successfully!")
+        else:
+            messagebox.showerror("Error", f"Failed to run Gource:\n{error}")
         
+        self.run_button.config(state=tk.NORMAL)
         self.status_bar.config(text="Ready")
@@ -1,21 +1,61 @@
 """Enhanced main window for Gource GUI with video export functionality"""
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import functools
 import os
+import queue
+import re
+import subprocess
 import threading
-from typing import Optional
+from types import MappingProxyType
+from typing import Optional, Tuple, Mapping, Any
+
+try:
+    from tkinter import colorchooser
+    COLORCHOOSER_AVAILABLE = True
+except ImportError:
+    COLORCHOOSER_AVAILABLE = False
 
 from core.gource_runner import GourceRunner
 from core.video_exporter import VideoExporter
 
+# Frame number in the exporter's progress messages ("... (frame 123)")
+_FRAME_RE = re.compile(r'\(frame (\d+)\)')
+
+# Mirrored in place of a setting whose field doesn't hold a valid value
+_INVALID_SETTING = object()
+
 class GourceGUIApp:
     """Main application window for Gource GUI with video export"""
     
+    # Milliseconds between applying queued export events (~30 Hz)
+    EXPORT_DRAIN_MS = 33
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         self.runner = GourceRunner()
         self.video_exporter = VideoExporter()
+        # Read-only and fixed per exporter, so resolved once
+        self._formats = self.video_exporter.get_supported_formats()
+        self._quality_presets = self.video_exporter.get_quality_presets()
         self.current_repo_path = ""
+        # Dependency probe results, refreshed only by _check_dependencies
+        self._gource_ok: Optional[bool] = None
+        self._ffmpeg_ok: Optional[bool] = None
+        self._dep_queue: queue.Queue = queue.Queue()
+        # Pending debounced repository check
+        self._repo_check_after_id: Optional[str] = None
+        # Export events are (export id, kind, payload); only the latest id is applied
+        self._export_queue: queue.Queue = queue.Queue()
+        self._export_id = 0
+        self._export_done_pending = False
+        self._export_cancelled = False
+        self._export_drain_after_id: Optional[str] = None
+        self._export_total_frames: Optional[int] = None
+        self._preview_dialog: Optional[tk.Toplevel] = None
+        self._preview_text: Optional[tk.Text] = None
+        # (repo path, settings object) the preview text was built from
+        self._preview_source: Optional[Tuple[str, Mapping[str, Any]]] = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -41,6 +81,26 @@ class GourceGUIApp:
         # Status bar
         self._create_status_bar()
         
+        # Settings are re-read only after one of their variables changes
+        self._settings_vars = {
+            'resolution': self.resolution_var,
+            'custom_width': self.custom_width_var,
+            'custom_height': self.custom_height_var,
+            'seconds_per_day': self.seconds_var,
+            'auto_skip_seconds': self.auto_skip_var,
+            'fullscreen': self.fullscreen_var,
+            'hide_filenames': self.hide_filenames_var,
+            'hide_usernames': self.hide_usernames_var,
+            'hide_dirnames': self.hide_dirnames_var,
+            'background_color': self.bg_color_var,
+            'framerate': self.framerate_var
+        }
+        # Plain-Python copy of the variables, updated by write traces
+        self._settings_mirror = {key: var.get() for key, var in self._settings_vars.items()}
+        self._settings: Optional[Mapping[str, Any]] = None
+        for key, var in self._settings_vars.items():
+            var.trace_add('write', lambda *args, key=key: self._on_setting_changed(key))
+        
         # Check dependencies on startup
         self._check_dependencies()
     
@@ -83,15 +143,10 @@ class GourceGUIApp:
         self.notebook.add(settings_frame, text="Basic Settings")
         
         # Create a scrollable frame
-        canvas = tk.Canvas(settings_frame)
+        canvas = self.settings_canvas = tk.Canvas(settings_frame)
         scrollbar = ttk.Scrollbar(settings_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
@@ -106,13 +161,14 @@ class GourceGUIApp:
         self.custom_res_frame = ttk.Frame(scrollable_frame)
         self.custom_res_frame.grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5)
         
-        ttk.Label(self.custom_res_frame, text="Width:").pack(side=tk.LEFT)
+        # Gridded like the rest of the tab, so only one geometry manager lays it out
+        ttk.Label(self.custom_res_frame, text="Width:").grid(row=0, column=0)
         self.custom_width_var = tk.IntVar(value=1920)
-        ttk.Entry(self.custom_res_frame, textvariable=self.custom_width_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Entry(self.custom_res_frame, textvariable=self.custom_width_var, width=8).grid(row=0, column=1, padx=5)
         
-        ttk.Label(self.custom_res_frame, text="Height:").pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Label(self.custom_res_frame, text="Height:").grid(row=0, column=2, padx=(10, 0))
         self.custom_height_var = tk.IntVar(value=1080)
-        ttk.Entry(self.custom_res_frame, textvariable=self.custom_height_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Entry(self.custom_res_frame, textvariable=self.custom_height_var, width=8).grid(row=0, column=3, padx=5)
         
         # Hide custom resolution initially
         self.custom_res_frame.grid_remove()
@@ -166,6 +222,15 @@ class GourceGUIApp:
         # Pack scrollable frame
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        
+        # The content only changes size when the custom resolution row is toggled,
+        # so the scroll region is set here and in _on_resolution_changed, not on every <Configure>
+        self._update_settings_scrollregion()
+    
+    def _update_settings_scrollregion(self):
+        """Fit the settings canvas scroll region to its content"""
+        self.settings_canvas.update_idletasks()
+        self.settings_canvas.configure(scrollregion=self.settings_canvas.bbox("all"))
     
     def _create_video_export_tab(self):
         """Create video export settings tab"""
@@ -177,7 +242,9 @@ class GourceGUIApp:
         ffmpeg_frame.pack(fill=tk.X, pady=(0, 10))
         
         self.ffmpeg_status_label = ttk.Label(ffmpeg_frame, text="Checking FFmpeg...")
-        self.ffmpeg_status_label.pack(anchor=tk.W)
+        self.ffmpeg_status_label.pack(side=tk.LEFT)
+        
+        ttk.Button(ffmpeg_frame, text="Recheck", command=self._recheck_dependencies).pack(side=tk.RIGHT)
         
         # Output settings
         output_frame = ttk.LabelFrame(video_frame, text="Output Settings", padding=10)
@@ -200,7 +267,7 @@ class GourceGUIApp:
         ttk.Label(output_frame, text="Format:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.format_var = tk.StringVar(value="MP4 (H.264)")
         format_combo = ttk.Combobox(output_frame, textvariable=self.format_var, 
-                                   values=list(self.video_exporter.get_supported_formats().keys()),
+                                   values=list(self._formats),
                                    state="readonly")
         format_combo.grid(row=1, column=1, sticky=tk.W, pady=5, padx=(10, 0))
         
@@ -208,7 +275,7 @@ class GourceGUIApp:
         ttk.Label(output_frame, text="Quality:").grid(row=2, column=0, sticky=tk.W, pady=5)
         self.quality_var = tk.StringVar(value="High (CRF 18)")
         quality_combo = ttk.Combobox(output_frame, textvariable=self.quality_var,
-                                    values=list(self.video_exporter.get_quality_presets().keys()),
+                                    values=list(self._quality_presets),
                                     state="readonly")
         quality_combo.grid(row=2, column=1, sticky=tk.W, pady=5, padx=(10, 0))
         
@@ -260,8 +327,10 @@ class GourceGUIApp:
         self.progress_label = ttk.Label(self.progress_frame, text="Export Progress:")
         self.progress_label.pack(anchor=tk.W)
         
+        # Determinate, driven by the frame count in progress messages; no animation timer
         self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(self.progress_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(self.progress_frame, mode='determinate',
+                                            variable=self.progress_var, maximum=100)
         self.progress_bar.pack(fill=tk.X, pady=(5, 0))
         
         self.progress_text = ttk.Label(self.progress_frame, text="")
@@ -289,23 +358,58 @@ class GourceGUIApp:
         self.status_bar = ttk.Label(self.root, text="Ready", relief=tk.SUNKEN)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
-    def _check_dependencies(self):
-        """Check if required dependencies are installed"""
-        # Check Gource
-        if self.runner.check_gource_installed():
+    def _check_dependencies(self, refresh: bool = False):
+        """Check if required dependencies are installed, without blocking the UI
+        
+        The probes run on a worker thread; _poll_dependencies picks up the
+        result on the Tk thread.
+        """
+        threading.Thread(target=self._probe_dependencies, args=(refresh,), daemon=True).start()
+        self.root.after(100, self._poll_dependencies)
+    
+    def _probe_dependencies(self, refresh: bool):
+        """Run the Gource and FFmpeg probes (worker thread; no widget access)"""
+        if refresh:
+            gource_ok = self.runner.refresh_gource_check()
+            ffmpeg_ok = self.video_exporter.refresh_ffmpeg_check()
+        else:
+            gource_ok = self.runner.check_gource_installed()
+            ffmpeg_ok = self.video_exporter.check_ffmpeg_installed()
+        self._dep_queue.put((gource_ok, ffmpeg_ok))
+    
+    def _poll_dependencies(self):
+        """Apply the dependency probe result once the worker has delivered it"""
+        try:
+            self._gource_ok, self._ffmpeg_ok = self._dep_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_dependencies)
+            return
+        
+        if self._gource_ok:
             gource_status = "✓ Gource installed"
         else:
             gource_status = "✗ Gource not found (install with: brew install gource)"
         
-        # Check FFmpeg
-        if self.video_exporter.check_ffmpeg_installed():
+        if self._ffmpeg_ok:
             ffmpeg_status = "✓ FFmpeg installed - Video export available"
         else:
             ffmpeg_status = "⚠ FFmpeg not found - Video export disabled"
-            self.export_button.config(state=tk.DISABLED)
         
         self.ffmpeg_status_label.config(text=ffmpeg_status)
         self._set_status(gource_status)
+        
+        # A running export owns the action buttons until it ends
+        if self.video_exporter.is_exporting:
+            return
+        if self.current_repo_path:
+            self._enable_buttons(True)
+        elif not self._ffmpeg_ok:
+            self.export_button.config(state=tk.DISABLED)
+    
+    def _recheck_dependencies(self):
+        """Probe for Gource and FFmpeg again, e.g. after installing them"""
+        self.ffmpeg_status_label.config(text="Checking FFmpeg...")
+        self._check_dependencies(refresh=True)
     
     def _on_resolution_changed(self, event=None):
         """Handle resolution selection change"""
@@ -313,24 +417,49 @@ class GourceGUIApp:
             self.custom_res_frame.grid()
         else:
             self.custom_res_frame.grid_remove()
+        self._update_settings_scrollregion()
     
     def _on_repo_path_changed(self, *args):
-        """Handle repository path changes"""
+        """Handle repository path changes, checking once typing pauses"""
+        if self._repo_check_after_id:
+            self.root.after_cancel(self._repo_check_after_id)
+        self._repo_check_after_id = self.root.after(200, self._do_repo_check)
+    
+    def _do_repo_check(self):
+        """Check the repository path currently entered"""
+        self._repo_check_after_id = None
         repo_path = self.repo_path_var.get().strip()
         
         if not repo_path:
             self.status_label.config(text="No repository selected")
             return
         
-        if os.path.exists(repo_path) and os.path.isdir(repo_path):
-            if os.path.exists(os.path.join(repo_path, '.git')):
-                self.current_repo_path = repo_path
-                repo_name = os.path.basename(repo_path)
-                self.status_label.config(text=f"✓ Repository: {repo_name}")
-                self._enable_buttons(True)
-            else:
-                self.status_label.config(text="✗ Not a Git repository")
-                self._enable_buttons(False)
+        # stat() can take a while on network mounts, so don't do it on the Tk thread
+        threading.Thread(target=self._check_repo_worker, args=(repo_path,), daemon=True).start()
+    
+    def _check_repo_worker(self, repo_path: str):
+        """Classify a path as 'git', 'not_git' or 'missing' (worker thread; no widget access)"""
+        if os.path.isdir(repo_path):
+            result = 'git' if os.path.exists(os.path.join(repo_path, '.git')) else 'not_git'
+        else:
+            result = 'missing'
+        self.root.after(0, self._on_repo_checked, repo_path, result)
+    
+    def _on_repo_checked(self, repo_path: str, result: str):
+        """Show a finished repository check if the path is still current"""
+        if self.repo_path_var.get().strip() == repo_path:
+            self._apply_repo_status(repo_path, result)
+    
+    def _apply_repo_status(self, repo_path: str, result: str):
+        """Update the repository status and buttons for a check result"""
+        if result == 'git':
+            self.current_repo_path = repo_path
+            repo_name = os.path.basename(repo_path)
+            self.status_label.config(text=f"✓ Repository: {repo_name}")
+            self._enable_buttons(True)
+        elif result == 'not_git':
+            self.status_label.config(text="✗ Not a Git repository")
+            self._enable_buttons(False)
         else:
             self.status_label.config(text="✗ Path does not exist")
             self._enable_buttons(False)
@@ -342,7 +471,7 @@ class GourceGUIApp:
         self.run_button.config(state=state)
         
         # Only enable export if FFmpeg is available
-        if enable and self.video_exporter.check_ffmpeg_installed():
+        if enable and self._ffmpeg_ok:
             self.export_button.config(state=tk.NORMAL)
         else:
             self.export_button.config(state=tk.DISABLED)
@@ -355,8 +484,7 @@ class GourceGUIApp:
     
     def _browse_output_file(self):
         """Browse for output video file location"""
-        formats = self.video_exporter.get_supported_formats()
-        current_format = formats.get(self.format_var.get(), "mp4")
+        current_format = self._formats.get(self.format_var.get(), "mp4")
         
         output_file = filedialog.asksaveasfilename(
             title="Save Video As",
@@ -372,30 +500,48 @@ class GourceGUIApp:
     
     def _pick_color(self):
         """Open color picker dialog"""
-        try:
-            import tkinter.colorchooser as colorchooser
-            color = colorchooser.askcolor(color=self.bg_color_var.get())[1]
-            if color:
-                self.bg_color_var.set(color)
-        except ImportError:
+        if not COLORCHOOSER_AVAILABLE:
             messagebox.showwarning("Color Picker", "Color picker not available. Please enter hex color manually (e.g., #001122)")
+            return
+        
+        color = colorchooser.askcolor(color=self.bg_color_var.get())[1]
+        if color:
+            self.bg_color_var.set(color)
     
-    def _get_settings(self):
-        """Get current settings from the GUI"""
-        settings = {
-            'resolution': self.resolution_var.get(),
-            'custom_width': self.custom_width_var.get(),
-            'custom_height': self.custom_height_var.get(),
-            'seconds_per_day': self.seconds_var.get(),
-            'auto_skip_seconds': self.auto_skip_var.get(),
-            'fullscreen': self.fullscreen_var.get(),
-            'hide_filenames': self.hide_filenames_var.get(),
-            'hide_usernames': self.hide_usernames_var.get(),
-            'hide_dirnames': self.hide_dirnames_var.get(),
-            'background_color': self.bg_color_var.get(),
-            'framerate': self.framerate_var.get()
-        }
-        return settings
+    def _on_setting_changed(self, key: str):
+        """Mirror one changed setting and invalidate the cached settings"""
+        try:
+            self._settings_mirror[key] = self._settings_vars[key].get()
+        except tk.TclError:
+            # Empty or half-typed number; reported when the settings are next used
+            self._settings_mirror[key] = _INVALID_SETTING
+        self._settings = None
+    
+    def _get_settings(self) -> Optional[Mapping[str, Any]]:
+        """Get current settings from the GUI (read-only, cached until a setting changes)
+        
+        Returns None, after telling the user which field is wrong, if a
+        setting doesn't currently hold a valid value.
+        """
+        if self._settings is None:
+            for key, value in self._settings_mirror.items():
+                if value is _INVALID_SETTING:
+                    name = key.replace('_', ' ')
+                    messagebox.showerror("Invalid Setting", f"Please enter a valid value for {name}.")
+                    return None
+            self._settings = MappingProxyType(dict(self._settings_mirror))
+        return self._settings
+    
+    def _get_command(self):
+        """Get the Gource command for the current repository and settings
+        
+        GourceRunner.build_command memoizes on (repo_path, settings), so
+        previewing and then running or exporting reuses the same argv.
+        """
+        settings = self._get_settings()
+        if settings is None:
+            return None
+        return self.runner.build_command(self.current_repo_path, settings)
     
     def _preview_command(self):
         """Preview the Gource command"""
@@ -403,32 +549,49 @@ class GourceGUIApp:
             messagebox.showwarning("No Repository", "Please select a repository first.")
             return
         
+        # _get_settings returns the same object until a setting changes, so an
+        # unchanged (path, settings) pair means the dialog already shows this command
         settings = self._get_settings()
-        cmd = self.runner.build_command(self.current_repo_path, settings)
+        if settings is None:
+            return
         
-        # Show command preview dialog
-        dialog = tk.Toplevel(self.root)
+        if self._preview_dialog is None:
+            self._create_preview_dialog()
+        
+        shown = self._preview_source
+        if shown is None or shown[0] != self.current_repo_path or shown[1] is not settings:
+            cmd = self.runner.build_command(self.current_repo_path, settings)
+            formatted_cmd = " \\\n  ".join(cmd)
+            self._preview_text.config(state=tk.NORMAL)
+            self._preview_text.delete('1.0', tk.END)
+            self._preview_text.insert(tk.END, formatted_cmd)
+            self._preview_text.config(state=tk.DISABLED)
+            self._preview_source = (self.current_repo_path, settings)
+        
+        self._preview_dialog.deiconify()
+        self._preview_dialog.lift()
+    
+    def _create_preview_dialog(self):
+        """Create the command preview dialog; it is hidden on close and reused"""
+        dialog = self._preview_dialog = tk.Toplevel(self.root)
         dialog.title("Command Preview")
         dialog.geometry("700x400")
         dialog.transient(self.root)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
         
         text_frame = ttk.Frame(dialog)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         ttk.Label(text_frame, text="Gource Command:").pack(anchor=tk.W)
         
-        text_widget = tk.Text(text_frame, wrap=tk.WORD, height=15)
+        text_widget = self._preview_text = tk.Text(text_frame, wrap=tk.WORD, height=15)
         text_widget.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
         
         scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text_widget.config(yscrollcommand=scrollbar.set)
         
-        formatted_cmd = " \\\n  ".join(cmd)
-        text_widget.insert(tk.END, formatted_cmd)
-        text_widget.config(state=tk.DISABLED)
-        
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
+        ttk.Button(dialog, text="Close", command=dialog.withdraw).pack(pady=10)
     
     def _run_gource(self):
         """Run Gource with current settings"""
@@ -436,19 +599,43 @@ class GourceGUIApp:
             messagebox.showwarning("No Repository", "Please select a repository first.")
             return
         
-        settings = self._get_settings()
-        cmd = self.runner.build_command(self.current_repo_path, settings)
+        cmd = self._get_command()
+        if cmd is None:
+            return
         
         self._set_status(f"Running Gource: {' '.join(cmd[:3])}...")
+        self.run_button.config(state=tk.DISABLED)
         
+        # Popen can take tens of milliseconds (fork/exec), so keep it off the Tk thread
+        threading.Thread(
+            target=self._launch_gource,
+            args=(cmd, self.current_repo_path),
+            daemon=True
+        ).start()
+    
+    def _launch_gource(self, cmd, repo_path):
+        """Start Gource in a worker thread and report back on the Tk thread"""
         try:
-            import subprocess
-            subprocess.Popen(cmd, cwd=self.current_repo_path)
+            # Nothing reads Gource's console output, so don't give it pipes to fill
+            subprocess.Popen(cmd, cwd=repo_path,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            error = None
+        except Exception as e:
+            error = str(e)
+        self.root.after(0, self._on_gource_launched, error)
+    
+    def _on_gource_launched(self, error: Optional[str]):
+        """Show the outcome of starting Gource"""
+        if error is None:
             messagebox.showinfo("Success", "Gource started successfully!")
             self._set_status("Gource visualization started")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to run Gource:\n{str(e)}")
+        else:
+            messagebox.showerror("Error", f"Failed to run Gource:\n{error}")
             self._set_status("Failed to start Gource")
+        
+        # Export may have started meanwhile and owns the Run button until it ends
+        if not self.video_exporter.is_exporting:
+            self.run_button.config(state=tk.NORMAL)
     
     def _export_video(self):
         """Export Gource visualization to video"""
@@ -460,13 +647,29 @@ class GourceGUIApp:
             messagebox.showwarning("No Output File", "Please specify an output file path.")
             return
         
-        # Get settings and build command
+        # Build command from the current settings
         settings = self._get_settings()
+        if settings is None:
+            return
         cmd = self.runner.build_command(self.current_repo_path, settings)
         
-        # Show progress UI
+        # Events still queued from an earlier export are stale
+        self._export_id += 1
+        export_id = self._export_id
+        self._export_done_pending = True
+        self._export_cancelled = False
+        while True:
+            try:
+                self._export_queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        # Show progress UI; the bar moves once the frame estimate arrives
         self.progress_frame.pack(fill=tk.X, pady=(10, 0))
-        self.progress_bar.start()
+        self.progress_var.set(0)
+        self._export_total_frames = None
+        threading.Thread(target=self._estimate_export_frames,
+                         args=(export_id, self.current_repo_path, settings), daemon=True).start()
         
         # Update button states
         self.export_button.config(state=tk.DISABLED)
@@ -474,59 +677,116 @@ class GourceGUIApp:
         self.run_button.config(state=tk.DISABLED)
         
         # Start export
+        self._start_export_drain()
         success = self.video_exporter.export_video(
             cmd,
             self.output_path_var.get(),
             self.quality_var.get(),
             self.framerate_var.get(),
-            progress_callback=self._on_export_progress,
-            error_callback=self._on_export_error,
-            completion_callback=self._on_export_complete
+            progress_callback=functools.partial(self._on_export_progress, export_id),
+            error_callback=functools.partial(self._on_export_error, export_id),
+            completion_callback=functools.partial(self._on_export_complete, export_id)
         )
         
         if not success:
+            self._export_done_pending = False  # No completion event will follow
             self._reset_export_ui()
     
     def _cancel_export(self):
         """Cancel ongoing video export"""
         if self.video_exporter.cancel_export():
-            self._set_status("Video export cancelled")
-            self._reset_export_ui()
+            # The UI is reset once the export thread reports it has stopped
+            self._export_cancelled = True
+            self.cancel_export_button.config(state=tk.DISABLED)
+            self._set_status("Cancelling video export...")
         else:
             messagebox.showwarning("Cancel Failed", "Could not cancel the export process.")
     
-    def _on_export_progress(self, message):
+    # Export callbacks run on the export thread; they only queue events,
+    # which _drain_export_events applies on the Tk thread
+    
+    def _on_export_progress(self, export_id, message):
         """Handle export progress updates"""
-        self.root.after(0, lambda: [
-            self.progress_text.config(text=message),
-            self._set_status(f"Export: {message}")
-        ])
+        self._export_queue.put((export_id, 'progress', message))
     
-    def _on_export_error(self, error_message):
+    def _on_export_error(self, export_id, error_message):
         """Handle export errors"""
-        self.root.after(0, lambda: [
-            messagebox.showerror("Export Error", f"Video export failed:\n\n{error_message}"),
-            self._reset_export_ui(),
-            self._set_status("Export failed")
-        ])
+        self._export_queue.put((export_id, 'error', error_message))
     
-    def _on_export_complete(self, success, message):
+    def _on_export_complete(self, export_id, success, message):
         """Handle export completion"""
-        self.root.after(0, lambda: [
-            messagebox.showinfo("Export Complete" if success else "Export Failed", message),
-            self._reset_export_ui(),
-            self._set_status("Export completed" if success else "Export failed")
-        ])
+        self._export_queue.put((export_id, 'done', (success, message)))
+    
+    def _estimate_export_frames(self, export_id, repo_path, settings):
+        """Estimate the export's frame count (worker thread; no widget access)"""
+        total = self.runner.estimate_frame_count(repo_path, settings)
+        self._export_queue.put((export_id, 'total', total))
+    
+    def _start_export_drain(self):
+        """Start draining export events, unless the drain loop is already running"""
+        if self._export_drain_after_id is None:
+            self._export_drain_after_id = self.root.after(self.EXPORT_DRAIN_MS, self._drain_export_events)
+    
+    def _drain_export_events(self):
+        """Apply queued export events, showing only the newest progress message"""
+        latest_progress = None
+        while True:
+            try:
+                export_id, kind, payload = self._export_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if export_id != self._export_id:
+                continue  # Left over from an earlier export
+            if kind == 'progress':
+                if not self._export_cancelled:
+                    latest_progress = payload
+                continue
+            if kind == 'total':
+                self._export_total_frames = payload
+                continue
+            
+            # Progress from before an error/completion must not overwrite its status
+            latest_progress = None
+            if kind == 'error':
+                # A cancelled export fails by design; don't report it as an error
+                if not self._export_cancelled:
+                    messagebox.showerror("Export Error", f"Video export failed:\n\n{payload}")
+                    self._reset_export_ui()
+                    self._set_status("Export failed")
+            else:
+                self._export_done_pending = False
+                self._reset_export_ui()
+                if self._export_cancelled:
+                    self._set_status("Video export cancelled")
+                else:
+                    success, message = payload
+                    messagebox.showinfo("Export Complete" if success else "Export Failed", message)
+                    self._set_status("Export completed" if success else "Export failed")
+        
+        if latest_progress is not None:
+            self.progress_text.config(text=latest_progress)
+            self._set_status(f"Export: {latest_progress}")
+            match = _FRAME_RE.search(latest_progress)
+            if match and self._export_total_frames:
+                # The estimate is an upper bound; leave the last step for completion
+                percent = int(match.group(1)) * 100 / self._export_total_frames
+                self.progress_var.set(min(percent, 99))
+        
+        # Keep polling until the export's completion event has been applied
+        if self._export_done_pending or not self._export_queue.empty():
+            self._export_drain_after_id = self.root.after(self.EXPORT_DRAIN_MS, self._drain_export_events)
+        else:
+            self._export_drain_after_id = None
     
     def _reset_export_ui(self):
         """Reset export UI to initial state"""
         self.progress_frame.pack_forget()
-        self.progress_bar.stop()
-        self.export_button.config(state=tk.NORMAL if self.current_repo_path else tk.DISABLED)
+        self.progress_var.set(0)
+        self.export_button.config(state=tk.NORMAL if self.current_repo_path and self._ffmpeg_ok else tk.DISABLED)
         self.cancel_export_button.config(state=tk.DISABLED)
         self.run_button.config(state=tk.NORMAL if self.current_repo_path else tk.DISABLED)
     
     def _set_status(self, message):
-        """Update status bar"""
+        """Update status bar (redrawn when Tk is next idle)"""
         self.status_bar.config(text=message)
-        self.root.update_idletasks()
@@ -6,13 +6,30 @@ Provides a user-friendly graphical installation experience
 
 import os
 import sys
+import importlib
+import importlib.util
+import locale
 import platform
+import shlex
+import signal
 import subprocess
 import shutil
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Tuple
+
+# Result of an external tool probe: (status, status text, log message, log level)
+ProbeResult = Tuple[str, str, str, str]
+
+try:
+    from importlib import metadata
+    from packaging.requirements import Requirement, InvalidRequirement
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
 
 try:
     import tkinter as tk
@@ -23,14 +40,42 @@ except ImportError:
     print("  python3 install.py")
     sys.exit(1)
 
+def _desktop_exec_arg(value: str) -> str:
+    """Quote one argument for the Exec key of a .desktop file
+    
+    Inside quotes the spec reserves ", `, $ and \\, which are backslash-escaped;
+    the key's string escaping then doubles every backslash, and % must be
+    doubled so it isn't read as a field code.
+    """
+    for char in '\\"`$':
+        value = value.replace(char, '\\' + char)
+    return '"' + value.replace('\\', '\\\\').replace('%', '%%') + '"'
+
 class GourceGUIInstallerWindow:
+    # Milliseconds between writes of queued log entries to the log widget
+    LOG_FLUSH_MS = 100
+    
+    # Arguments that make each external tool print something and exit 0
+    PROBE_ARGS = {
+        'git': ('--version',),
+        'gource': ('--help',),
+        'ffmpeg': ('-version',),
+    }
+    
     def __init__(self):
         self.root = tk.Tk()
-        self.system = platform.system().lower()
+        # Platform details are fixed for the process, so look them up once
+        self.system_name = platform.system()
+        self.system_release = platform.release()
+        self.machine = platform.machine()
+        self.system = self.system_name.lower()
         self.python_version = sys.version_info
+        self.python_version_str = sys.version.split()[0]
         self.project_dir = Path(__file__).parent
         self.installation_thread = None
         self.installation_cancelled = False
+        self._log_queue = deque()
+        self._log_lock = threading.Lock()
         
         # Installation status tracking
         self.checks = {
@@ -94,9 +139,9 @@ class GourceGUIInstallerWindow:
         info_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
         
         system_info = f"""
-Operating System: {platform.system()} {platform.release()}
-Architecture: {platform.machine()}
-Python Version: {sys.version.split()[0]}
+Operating System: {self.system_name} {self.system_release}
+Architecture: {self.machine}
+Python Version: {self.python_version_str}
 Installation Path: {self.project_dir}
         """.strip()
         
@@ -182,10 +227,11 @@ Installation Path: {self.project_dir}
             wrap=tk.WORD
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.flush_log()
         
         # Add initial message
         self.log("Gource GUI Installer started")
-        self.log(f"System: {platform.system()} {platform.release()}")
+        self.log(f"System: {self.system_name} {self.system_release}")
         self.log(f"Python: {sys.version}")
         
     def create_buttons(self):
@@ -245,16 +291,27 @@ Installation Path: {self.project_dir}
         credits_label.pack()
         
     def log(self, message: str, level: str = "INFO"):
-        """Add message to installation log"""
+        """Add message to installation log (safe from any thread)
+        
+        Entries are queued and written by flush_log in batches.
+        """
         timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}\n"
+        with self._log_lock:
+            self._log_queue.append(f"[{timestamp}] {level}: {message}\n")
         
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    def flush_log(self):
+        """Write queued log entries with one insert, then reschedule (Tk thread)"""
+        with self._log_lock:
+            entries = ''.join(self._log_queue)
+            self._log_queue.clear()
+        
+        if entries:
+            self.log_text.insert(tk.END, entries)
+            self.log_text.see(tk.END)
+        self.root.after(self.LOG_FLUSH_MS, self.flush_log)
         
     def update_requirement_status(self, key: str, status: str, text: str):
-        """Update requirement check status"""
+        """Update requirement check status (Tk thread; workers post it with root.after)"""
         icons = {
             'pending': '⏳',
             'checking': '🔍',
@@ -276,7 +333,6 @@ Installation Path: {self.project_dir}
             self.req_labels[key]['text'].set(text)
             
         self.checks[key]['status'] = status
-        self.root.update_idletasks()
         
     def start_system_check(self):
         """Start checking system requirements in a separate thread"""
@@ -291,82 +347,131 @@ Installation Path: {self.project_dir}
         self.log("Starting system requirements check...")
         
         # Check Python version
-        self.update_requirement_status('python', 'checking', 'Checking version...')
+        self.root.after(0, self.update_requirement_status, 'python', 'checking', 'Checking version...')
         if self.python_version >= (3, 7):
-            self.update_requirement_status('python', 'success', f'Version {sys.version.split()[0]}')
-            self.log(f"Python version check passed: {sys.version.split()[0]}")
+            self.root.after(0, self.update_requirement_status, 'python', 'success', f'Version {self.python_version_str}')
+            self.log(f"Python version check passed: {self.python_version_str}")
         else:
-            self.update_requirement_status('python', 'error', f'Version {sys.version.split()[0]} too old')
-            self.log(f"Python version check failed: {sys.version.split()[0]} (need 3.7+)", "ERROR")
+            self.root.after(0, self.update_requirement_status, 'python', 'error', f'Version {self.python_version_str} too old')
+            self.log(f"Python version check failed: {self.python_version_str} (need 3.7+)", "ERROR")
             
         # Check tkinter
-        self.update_requirement_status('tkinter', 'checking', 'Checking availability...')
+        self.root.after(0, self.update_requirement_status, 'tkinter', 'checking', 'Checking availability...')
         try:
             import tkinter
-            self.update_requirement_status('tkinter', 'success', 'Available')
+            self.root.after(0, self.update_requirement_status, 'tkinter', 'success', 'Available')
             self.log("tkinter check passed")
         except ImportError:
-            self.update_requirement_status('tkinter', 'error', 'Not available')
+            self.root.after(0, self.update_requirement_status, 'tkinter', 'error', 'Not available')
             self.log("tkinter check failed", "ERROR")
             
-        # Check Git
-        self.update_requirement_status('git', 'checking', 'Checking installation...')
-        if shutil.which('git'):
-            try:
-                result = subprocess.run(['git', '--version'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    version = result.stdout.strip()
-                    self.update_requirement_status('git', 'success', 'Installed')
-                    self.log(f"Git check passed: {version}")
-                else:
-                    self.update_requirement_status('git', 'error', 'Not working')
-                    self.log("Git check failed: command error", "ERROR")
-            except (subprocess.TimeoutExpired, Exception) as e:
-                self.update_requirement_status('git', 'error', 'Not working')
-                self.log(f"Git check failed: {e}", "ERROR")
-        else:
-            self.update_requirement_status('git', 'error', 'Not installed')
-            self.log("Git check failed: not found in PATH", "ERROR")
-            
-        # Check Gource
-        self.update_requirement_status('gource', 'checking', 'Checking installation...')
-        if shutil.which('gource'):
-            try:
-                result = subprocess.run(['gource', '--help'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    self.update_requirement_status('gource', 'success', 'Installed')
-                    self.log("Gource check passed")
-                else:
-                    self.update_requirement_status('gource', 'error', 'Not working')
-                    self.log("Gource check failed: command error", "ERROR")
-            except (subprocess.TimeoutExpired, Exception) as e:
-                self.update_requirement_status('gource', 'error', 'Not working')
-                self.log(f"Gource check failed: {e}", "ERROR")
-        else:
-            self.update_requirement_status('gource', 'error', 'Not installed')
-            self.log("Gource check failed: not found in PATH", "ERROR")
-            
-        # Check FFmpeg (optional)
-        self.update_requirement_status('ffmpeg', 'checking', 'Checking installation...')
-        if shutil.which('ffmpeg'):
-            try:
-                result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    self.update_requirement_status('ffmpeg', 'success', 'Installed')
-                    self.log("FFmpeg check passed")
-                else:
-                    self.update_requirement_status('ffmpeg', 'warning', 'Not working')
-                    self.log("FFmpeg check failed: command error", "WARNING")
-            except (subprocess.TimeoutExpired, Exception) as e:
-                self.update_requirement_status('ffmpeg', 'warning', 'Not working')
-                self.log(f"FFmpeg check failed: {e}", "WARNING")
+        # Git, Gource and FFmpeg are independent processes, so probe them side by
+        # side; the phase then takes as long as the slowest probe, not their sum
+        probes = {
+            'git': self._probe_git,
+            'gource': self._probe_gource,
+            'ffmpeg': self._probe_ffmpeg,
+        }
+        paths = {key: shutil.which(key) for key in probes}
+        installed = {key: path for key, path in paths.items() if path}
+        for key in probes:
+            self.root.after(0, self.update_requirement_status, key, 'checking', 'Checking installation...')
+        
+        if os.name == 'posix':
+            # One shell runs all probes, so this process only spawns once
+            outcomes = self._run_probes_in_shell(installed)
+            for key, probe in probes.items():
+                self.root.after(0, self.apply_probe_result, key, *probe(paths[key], outcomes.get(key)))
         else:
-            self.update_requirement_status('ffmpeg', 'warning', 'Not installed')
-            self.log("FFmpeg not found (video export will be disabled)", "WARNING")
+            # cmd.exe chaining would add a process rather than save one
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                futures = {executor.submit(self._run_probe, path, self.PROBE_ARGS[key]): key
+                           for key, path in installed.items()}
+                for key in probes.keys() - installed.keys():
+                    self.root.after(0, self.apply_probe_result, key, *probes[key](None, None))
+                for future in as_completed(futures):
+                    key = futures[future]
+                    self.root.after(0, self.apply_probe_result, key,
+                                    *probes[key](paths[key], future.result()))
             
-        # Check if ready to install
+        # Check if ready to install (runs after the queued probe results)
         self.root.after(0, self.check_installation_readiness)
         
+    def apply_probe_result(self, key: str, status: str, text: str, message: str, level: str):
+        """Show an external tool probe result (Tk thread)"""
+        self.update_requirement_status(key, status, text)
+        self.log(message, level)
+        
+    def _run_probe(self, path: str, args: Tuple[str, ...]) -> Tuple[bool, str]:
+        """Run a tool probe, returning (success, stdout or error description)"""
+        try:
+            result = subprocess.run([path, *args], capture_output=True, text=True, timeout=5)
+        except (subprocess.TimeoutExpired, Exception) as e:
+            return False, str(e)
+        if result.returncode != 0:
+            return False, "command error"
+        return True, result.stdout.strip()
+        
+    def _run_probes_in_shell(self, paths: Dict[str, str]) -> Dict[str, Tuple[bool, str]]:
+        """Run several tool probes concurrently from a single sh process
+        
+        Returns (success, first line of stdout or error description) per key,
+        like _run_probe.
+        """
+        # Each probe runs in a background subshell and reports one short line,
+        # "<key> <exit status> <first line of output>"
+        script = ['nl="\n"']
+        for key, path in paths.items():
+            command = ' '.join((shlex.quote(path), *self.PROBE_ARGS[key]))
+            script.append(f'(out=$({command} 2>/dev/null); echo "{key} $? ${{out%%"$nl"*}}") &')
+        script.append('wait')
+        
+        process = subprocess.Popen(['sh', '-c', '\n'.join(script)], stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True, start_new_session=True)
+        try:
+            output, _ = process.communicate(timeout=10)
+        except subprocess.TimeoutExpired as e:
+            # Kill the probes too, or they would keep the pipe open
+            os.killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            output, error = '', f"timed out after {e.timeout} seconds"
+        else:
+            error = "command error"
+        
+        outcomes = {key: (False, error) for key in paths}
+        for line in output.splitlines():
+            key, status, first_line = (line.split(' ', 2) + [''])[:3]
+            if key in outcomes and status == '0':
+                outcomes[key] = (True, first_line.strip())
+        return outcomes
+        
+    def _probe_git(self, path: Optional[str], outcome: Optional[Tuple[bool, str]]) -> ProbeResult:
+        """Interpret the Git probe"""
+        if not path:
+            return 'error', 'Not installed', "Git check failed: not found in PATH", "ERROR"
+        ok, output = outcome
+        if ok:
+            return 'success', 'Installed', f"Git check passed: {output}", "INFO"
+        return 'error', 'Not working', f"Git check failed: {output}", "ERROR"
+        
+    def _probe_gource(self, path: Optional[str], outcome: Optional[Tuple[bool, str]]) -> ProbeResult:
+        """Interpret the Gource probe"""
+        if not path:
+            return 'error', 'Not installed', "Gource check failed: not found in PATH", "ERROR"
+        ok, output = outcome
+        if ok:
+            return 'success', 'Installed', "Gource check passed", "INFO"
+        return 'error', 'Not working', f"Gource check failed: {output}", "ERROR"
+        
+    def _probe_ffmpeg(self, path: Optional[str], outcome: Optional[Tuple[bool, str]]) -> ProbeResult:
+        """Interpret the FFmpeg (optional) probe"""
+        if not path:
+            return 'warning', 'Not installed', "FFmpeg not found (video export will be disabled)", "WARNING"
+        ok, output = outcome
+        if ok:
+            return 'success', 'Installed', "FFmpeg check passed", "INFO"
+        return 'warning', 'Not working', f"FFmpeg check failed: {output}", "WARNING"
+        
     def check_installation_readiness(self):
         """Check if all required dependencies are met"""
         ready = True
@@ -432,20 +537,22 @@ Installation Path: {self.project_dir}
             self.root.after(0, lambda: self.progress_var.set(20))
             
             # Install Python dependencies
-            self.update_requirement_status('python_deps', 'checking', 'Installing...')
+            self.root.after(0, self.update_requirement_status, 'python_deps', 'checking', 'Installing...')
             self.log("Installing Python dependencies...")
             
             requirements_file = self.project_dir / "requirements.txt"
-            if requirements_file.exists():
-                cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
-                result = subprocess.run(cmd, capture_output=True, text=True)
+            if requirements_file.exists() and self.requirements_already_satisfied(requirements_file):
+                self.root.after(0, self.update_requirement_status, 'python_deps', 'success', 'Installed')
+                self.log("All dependencies already satisfied - skipping pip")
+            elif requirements_file.exists():
+                returncode, output_tail = self.install_requirements(requirements_file)
                 
-                if result.returncode == 0:
-                    self.update_requirement_status('python_deps', 'success', 'Installed')
+                if returncode == 0:
+                    self.root.after(0, self.update_requirement_status, 'python_deps', 'success', 'Installed')
                     self.log("Python dependencies installed successfully")
                 else:
-                    self.update_requirement_status('python_deps', 'error', 'Failed')
-                    self.log(f"Failed to install Python dependencies: {result.stderr}", "ERROR")
+                    self.root.after(0, self.update_requirement_status, 'python_deps', 'error', 'Failed')
+                    self.log(f"Failed to install Python dependencies: {output_tail}", "ERROR")
                     self.root.after(0, self.installation_failed)
                     return
             else:
@@ -461,13 +568,12 @@ Installation Path: {self.project_dir}
             
             # Test installation
             self.log("Testing installation...")
-            cmd = [sys.executable, "-c", "import sys; sys.path.insert(0, '.'); from gui.main_window_with_video import GourceGUIApp; print('Success')"]
-            result = subprocess.run(cmd, cwd=self.project_dir, capture_output=True, text=True, timeout=10)
+            passed, error = self.test_app_import()
             
-            if result.returncode == 0:
+            if passed:
                 self.log("Installation test passed")
             else:
-                self.log(f"Installation test failed: {result.stderr}", "ERROR")
+                self.log(f"Installation test failed: {error}", "ERROR")
                 self.root.after(0, self.installation_failed)
                 return
                 
@@ -487,47 +593,153 @@ Installation Path: {self.project_dir}
             self.log(f"Installation failed with error: {e}", "ERROR")
             self.root.after(0, self.installation_failed)
             
+    def requirements_already_satisfied(self, requirements_file: Path) -> bool:
+        """Check whether every requirement is already installed at a matching version
+        
+        Anything this can't judge (no packaging module, pip options, unparsable
+        lines) counts as unsatisfied, so pip still runs.
+        """
+        if not PACKAGING_AVAILABLE:
+            return False
+        try:
+            for line in requirements_file.read_text().splitlines():
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                if line.startswith('-'):
+                    return False
+                
+                requirement = Requirement(line)
+                if requirement.marker and not requirement.marker.evaluate():
+                    continue
+                if not requirement.specifier.contains(metadata.version(requirement.name),
+                                                      prereleases=True):
+                    return False
+        except (OSError, InvalidRequirement, metadata.PackageNotFoundError):
+            return False
+        return True
+        
+    def install_requirements(self, requirements_file: Path) -> Tuple[int, str]:
+        """Install requirements, streaming the installer's output into the log
+        
+        uv (resolves and downloads in parallel) is used when it is on PATH,
+        with pip as the fallback if uv is missing or fails. Returns the exit
+        code and the last lines of output.
+        """
+        pip_cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
+        uv = shutil.which("uv")
+        if uv:
+            uv_cmd = [uv, "pip", "install", "--python", sys.executable, "-r", str(requirements_file)]
+            returncode, output = self._run_installer(uv_cmd)
+            if returncode == 0:
+                return returncode, output
+            # e.g. non-writable system site-packages, where pip falls back to --user
+            self.log(f"uv exited with code {returncode}, retrying with pip")
+        return self._run_installer(pip_cmd)
+
+    def _run_installer(self, cmd: List[str]) -> Tuple[int, str]:
+        """Run an installer command, streaming its output into the log"""
+        self.log(f"Running: {' '.join(cmd)}")
+
+        tail = deque(maxlen=20)
+        progress = 20
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   bufsize=1, text=True)
+        with process.stdout:
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                self.log(line)
+                
+                # Move the bar through 20-60% as packages are fetched and installed
+                if line.startswith(('Collecting ', 'Installing ')) and progress < 55:
+                    progress += 5
+                    self.root.after(0, self.progress_var.set, progress)
+        
+        return process.wait(), '\n'.join(tail)
+        
+    def test_app_import(self) -> Tuple[bool, str]:
+        """Check that the main window module imports, returning (passed, error)
+        
+        The import runs in this interpreter, which is much cheaper than starting
+        a new one. A fresh interpreter is only used to confirm a failure, since
+        this process may still hold stale state from before pip ran.
+        """
+        project_dir = str(self.project_dir)
+        if project_dir not in sys.path:
+            sys.path.insert(0, project_dir)
+        # Packages pip just installed aren't in the import system's directory caches yet
+        importlib.invalidate_caches()
+        
+        try:
+            if importlib.util.find_spec("gui.main_window_with_video") is not None:
+                module = importlib.import_module("gui.main_window_with_video")
+                if getattr(module, "GourceGUIApp", None) is not None:
+                    return True, ""
+        except Exception:
+            pass
+        
+        cmd = [sys.executable, "-c", "import sys; sys.path.insert(0, '.'); from gui.main_window_with_video import GourceGUIApp; print('Success')"]
+        result = subprocess.run(cmd, cwd=self.project_dir, capture_output=True, text=True, timeout=10)
+        return result.returncode == 0, result.stderr
+        
     def create_desktop_shortcut(self):
         """Create desktop shortcut"""
         try:
             main_py = self.project_dir / "main.py"
+            # Shared bytecode cache, so launches reuse .pyc files even if the
+            # project directory is read-only; -OO drops docstrings and asserts
+            pycache_dir = Path.home() / ".cache" / "gource-gui"
             
             if self.system == "darwin":
                 shortcut_path = Path.home() / "Desktop" / "Gource GUI.command"
-                shortcut_content = f'''#!/bin/bash
-cd "{self.project_dir}"
-python3 "{main_py}"
-'''
-                shortcut_path.write_text(shortcut_content)
+                shortcut_content = "\n".join([
+                    "#!/bin/bash",
+                    f'cd "{self.project_dir}"',
+                    f'export PYTHONPYCACHEPREFIX="{pycache_dir}"',
+                    f'python3 -OO "{main_py}"',
+                    "",
+                ])
+                shortcut_path.write_bytes(shortcut_content.encode("utf-8"))
                 os.chmod(shortcut_path, 0o755)
                 self.log(f"Desktop shortcut created: {shortcut_path}")
                 
             elif self.system == "linux":
                 shortcut_path = Path.home() / "Desktop" / "gource-gui.desktop"
-                shortcut_content = f'''[Desktop Entry]
-Version=1.0
-Type=Application
-Name=Gource GUI
-Comment=GUI for Gource version control visualization
-Exec=python3 "{main_py}"
-Icon=applications-multimedia
-Path={self.project_dir}
-Terminal=false
-StartupNotify=true
-Categories=Development;Graphics;
-'''
-                shortcut_path.write_text(shortcut_content)
+                shortcut_content = "\n".join([
+                    "[Desktop Entry]",
+                    "Version=1.0",
+                    "Type=Application",
+                    "Name=Gource GUI",
+                    "Comment=GUI for Gource version control visualization",
+                    f"Exec=env {_desktop_exec_arg(f'PYTHONPYCACHEPREFIX={pycache_dir}')} "
+                    f"python3 -OO {_desktop_exec_arg(str(main_py))}",
+                    "Icon=applications-multimedia",
+                    f"Path={self.project_dir}",
+                    "Terminal=false",
+                    "StartupNotify=true",
+                    "Categories=Development;Graphics;",
+                    "",
+                ])
+                shortcut_path.write_bytes(shortcut_content.encode("utf-8"))
                 os.chmod(shortcut_path, 0o755)
                 self.log(f"Desktop shortcut created: {shortcut_path}")
                 
             elif self.system == "windows":
                 shortcut_path = Path.home() / "Desktop" / "Gource GUI.bat"
-                shortcut_content = f'''@echo off
-cd /d "{self.project_dir}"
-python "{main_py}"
-pause
-'''
-                shortcut_path.write_text(shortcut_content)
+                # Batch files want CRLF line endings, and cmd.exe reads them in the
+                # ANSI code page rather than UTF-8
+                shortcut_content = "\r\n".join([
+                    "@echo off",
+                    f'cd /d "{self.project_dir}"',
+                    f'set "PYTHONPYCACHEPREFIX={pycache_dir}"',
+                    f'python -OO "{main_py}"',
+                    "pause",
+                    "",
+                ])
+                shortcut_path.write_bytes(shortcut_content.encode(locale.getpreferredencoding(False)))
                 self.log(f"Desktop shortcut created: {shortcut_path}")
                 
         except Exception as e:
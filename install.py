@@ -6,14 +6,91 @@ Handles dependencies, system requirements, and setup across macOS, Linux, and Wi
 
 import os
 import sys
+import asyncio
+import functools
+import importlib
+import importlib.util
+import locale
 import platform
 import subprocess
 import shutil
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+def _desktop_exec_arg(value: str) -> str:
+    """Quote one argument for the Exec key of a .desktop file
+    
+    Inside quotes the spec reserves ", `, $ and \\, which are backslash-escaped;
+    the key's string escaping then doubles every backslash, and % must be
+    doubled so it isn't read as a field code.
+    """
+    for char in '\\"`$':
+        value = value.replace(char, '\\' + char)
+    return '"' + value.replace('\\', '\\\\').replace('%', '%%') + '"'
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(name: str) -> Optional[str]:
+    """Resolve an executable on PATH at most once per process"""
+    return shutil.which(name)
 
 class GourceGUIInstaller:
+    # Arguments for the quick "is this tool working" check of each external tool
+    PROBE_ARGS = {
+        "git": ("--version",),
+        "gource": ("--help",),
+        "ffmpeg": ("-version",),
+    }
+    
+    # Per-platform instructions shown when a requirement is missing
+    INSTALL_HINTS = {
+        "tkinter": {
+            "linux": ("   sudo apt-get install python3-tk  # Ubuntu/Debian",
+                      "   sudo yum install tkinter         # RHEL/CentOS",
+                      "   sudo pacman -S tk               # Arch Linux"),
+            "darwin": ("   brew install python-tk",),
+            "windows": ("   tkinter should be included with Python installation",
+                        "   Try reinstalling Python from python.org"),
+        },
+        "gource": {
+            "darwin": ("   brew install gource",),
+            "linux": ("   sudo apt-get install gource     # Ubuntu/Debian",
+                      "   sudo yum install gource         # RHEL/CentOS",
+                      "   sudo pacman -S gource           # Arch Linux"),
+            "windows": ("   Download from: https://gource.io/",
+                        "   Or use chocolatey: choco install gource"),
+        },
+        "ffmpeg": {
+            "darwin": ("   brew install ffmpeg",),
+            "linux": ("   sudo apt-get install ffmpeg     # Ubuntu/Debian",
+                      "   sudo yum install ffmpeg         # RHEL/CentOS",
+                      "   sudo pacman -S ffmpeg           # Arch Linux"),
+            "windows": ("   Download from: https://ffmpeg.org/",
+                        "   Or use chocolatey: choco install ffmpeg"),
+        },
+        "git": {
+            "darwin": ("   brew install git",
+                       "   Or install Xcode Command Line Tools: xcode-select --install"),
+            "linux": ("   sudo apt-get install git        # Ubuntu/Debian",
+                      "   sudo yum install git            # RHEL/CentOS",
+                      "   sudo pacman -S git              # Arch Linux"),
+            "windows": ("   Download from: https://git-scm.com/",),
+        },
+    }
+    
+    # Desktop shortcut file created on each platform
+    SHORTCUT_NAMES = {
+        "darwin": "Gource GUI.command",
+        "linux": "gource-gui.desktop",
+        "windows": "Gource GUI.bat",
+    }
+    
     def __init__(self):
-        self.system = platform.system().lower()
+        # Looked up once; print_header and the platform branches reuse these
+        self.system_name = platform.system()
+        self.system_release = platform.release()
+        self.machine = platform.machine()
+        self.system = self.system_name.lower()
+        self._probe_results = None
         self.python_version = sys.version_info
         self.project_dir = Path(__file__).parent
         
@@ -21,9 +98,9 @@ class GourceGUIInstaller:
         print("=" * 60)
         print("         Gource GUI - Cross-Platform Installer")
         print("=" * 60)
-        print(f"System: {platform.system()} {platform.release()}")
+        print(f"System: {self.system_name} {self.system_release}")
         print(f"Python: {sys.version}")
-        print(f"Architecture: {platform.machine()}")
+        print(f"Architecture: {self.machine}")
         print("=" * 60)
         
     def check_python_version(self):
@@ -50,15 +127,8 @@ class GourceGUIInstaller:
             print("❌ tkinter - Not available")
             print("   Installation required:")
             
-            if self.system == "linux":
-                print("   sudo apt-get install python3-tk  # Ubuntu/Debian")
-                print("   sudo yum install tkinter         # RHEL/CentOS")
-                print("   sudo pacman -S tk               # Arch Linux")
-            elif self.system == "darwin":
-                print("   brew install python-tk")
-            elif self.system == "windows":
-                print("   tkinter should be included with Python installation")
-                print("   Try reinstalling Python from python.org")
+            for line in self.INSTALL_HINTS["tkinter"].get(self.system, ()):
+                print(line)
             
             return False
     
@@ -73,8 +143,28 @@ class GourceGUIInstaller:
             return False
         
         try:
-            cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = None
+            uv = _which_cached("uv")
+            if uv:
+                # uv resolves and downloads in parallel; target this interpreter
+                cmd = [uv, "pip", "install", "--python", sys.executable, "-r", str(requirements_file)]
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                if result.returncode != 0:
+                    # e.g. non-writable system site-packages, where pip falls back to --user
+                    print("⚠️  uv install failed, retrying with pip:")
+                    print(result.stderr)
+
+            if result is None or result.returncode != 0:
+                # Skip pip's self-update check and prompts, and avoid source builds
+                cmd = [sys.executable, "-m", "pip", "install",
+                       "--disable-pip-version-check", "--no-input", "--no-warn-script-location",
+                       "--prefer-binary", "-r", str(requirements_file)]
+                result = subprocess.run(cmd[:4] + ["--only-binary=:all:"] + cmd[4:],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                
+                if result.returncode != 0:
+                    # Some package has no wheel for this platform; allow building it
+                    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
             
             if result.returncode == 0:
                 print("✅ Python dependencies installed successfully")
@@ -87,137 +177,182 @@ class GourceGUIInstaller:
             print(f"❌ Error installing dependencies: {e}")
             return False
     
+    async def _probe_all_unix(self) -> Optional[Dict[str, bool]]:
+        """Run every tool probe from a single sh process"""
+        installed = [tool for tool in self.PROBE_ARGS if _which_cached(tool)]
+        results = {tool: False for tool in self.PROBE_ARGS}
+        if not installed:
+            return results
+        
+        # Each probe runs in the background and reports "<tool> <exit status>"
+        script = [f'{{ {tool} {" ".join(self.PROBE_ARGS[tool])} >/dev/null 2>&1; echo "{tool} $?"; }} &'
+                  for tool in installed]
+        script.append("wait")
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "sh", "-c", "\n".join(script),
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            output, _ = await proc.communicate()
+        except OSError:
+            return None
+        
+        for line in output.decode("ascii", "replace").splitlines():
+            tool, _, status = line.partition(" ")
+            if tool in results:
+                results[tool] = status == "0"
+        return results
+    
+    async def _probe(self, tool):
+        """Run a tool probe without blocking the other probes"""
+        if self._probe_results is not None:
+            return self._probe_results[tool]
+        
+        # PATH lookups are cached, so skip spawning for missing tools
+        if not _which_cached(tool):
+            return False
+        
+        try:
+            # Only the exit status matters, so don't pipe any output back
+            proc = await asyncio.create_subprocess_exec(
+                tool, *self.PROBE_ARGS[tool],
+                stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+            return await proc.wait() == 0
+        except Exception:
+            return False
+    
+    def _run_check(self, check) -> bool:
+        """Run one check coroutine on its own, printing its messages"""
+        ok, lines = asyncio.run(check)
+        for line in lines:
+            print(line)
+        return ok
+    
     def check_gource(self):
         """Check if Gource is installed"""
-        print("\n🎥 Checking Gource installation...")
-        
-        if shutil.which("gource"):
-            try:
-                result = subprocess.run(["gource", "--help"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print("✅ Gource - Installed and working")
-                    return True
-            except:
-                pass
-        
-        print("❌ Gource - Not found or not working")
-        print("   Installation required:")
-        
-        if self.system == "darwin":
-            print("   brew install gource")
-        elif self.system == "linux":
-            print("   sudo apt-get install gource     # Ubuntu/Debian")
-            print("   sudo yum install gource         # RHEL/CentOS")
-            print("   sudo pacman -S gource           # Arch Linux")
-        elif self.system == "windows":
-            print("   Download from: https://gource.io/")
-            print("   Or use chocolatey: choco install gource")
-        
-        return False
+        return self._run_check(self._check_gource_async())
     
     def check_ffmpeg(self):
         """Check if FFmpeg is installed (optional)"""
-        print("\n🎬 Checking FFmpeg installation (optional for video export)...")
-        
-        if shutil.which("ffmpeg"):
-            try:
-                result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print("✅ FFmpeg - Installed and working")
-                    return True
-            except:
-                pass
-        
-        print("⚠️  FFmpeg - Not found (video export will be disabled)")
-        print("   To enable video export, install FFmpeg:")
-        
-        if self.system == "darwin":
-            print("   brew install ffmpeg")
-        elif self.system == "linux":
-            print("   sudo apt-get install ffmpeg     # Ubuntu/Debian")
-            print("   sudo yum install ffmpeg         # RHEL/CentOS")
-            print("   sudo pacman -S ffmpeg           # Arch Linux")
-        elif self.system == "windows":
-            print("   Download from: https://ffmpeg.org/")
-            print("   Or use chocolatey: choco install ffmpeg")
-        
-        return False
+        return self._run_check(self._check_ffmpeg_async())
     
     def check_git(self):
         """Check if Git is installed"""
-        print("\n📁 Checking Git installation...")
-        
-        if shutil.which("git"):
-            try:
-                result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print("✅ Git - Installed and working")
-                    return True
-            except:
-                pass
-        
-        print("❌ Git - Not found")
-        print("   Git is required for repository analysis")
-        print("   Installation instructions:")
-        
-        if self.system == "darwin":
-            print("   brew install git")
-            print("   Or install Xcode Command Line Tools: xcode-select --install")
-        elif self.system == "linux":
-            print("   sudo apt-get install git        # Ubuntu/Debian")
-            print("   sudo yum install git            # RHEL/CentOS")
-            print("   sudo pacman -S git              # Arch Linux")
-        elif self.system == "windows":
-            print("   Download from: https://git-scm.com/")
-        
-        return False
+        return self._run_check(self._check_git_async())
+    
+    async def _check_gource_async(self) -> Tuple[bool, List[str]]:
+        """Check if Gource is installed, returning (passed, messages)"""
+        lines = ["\n🎥 Checking Gource installation..."]
+        
+        if await self._probe("gource"):
+            lines.append("✅ Gource - Installed and working")
+            return True, lines
+        
+        lines.append("❌ Gource - Not found or not working")
+        lines.append("   Installation required:")
+        lines.extend(self.INSTALL_HINTS["gource"].get(self.system, ()))
+        
+        return False, lines
+    
+    async def _check_ffmpeg_async(self) -> Tuple[bool, List[str]]:
+        """Check if FFmpeg is installed, returning (passed, messages)"""
+        lines = ["\n🎬 Checking FFmpeg installation (optional for video export)..."]
+        
+        if await self._probe("ffmpeg"):
+            lines.append("✅ FFmpeg - Installed and working")
+            return True, lines
+        
+        lines.append("⚠️  FFmpeg - Not found (video export will be disabled)")
+        lines.append("   To enable video export, install FFmpeg:")
+        lines.extend(self.INSTALL_HINTS["ffmpeg"].get(self.system, ()))
+        
+        return False, lines
+    
+    async def _check_git_async(self) -> Tuple[bool, List[str]]:
+        """Check if Git is installed, returning (passed, messages)"""
+        lines = ["\n📁 Checking Git installation..."]
+        
+        if await self._probe("git"):
+            lines.append("✅ Git - Installed and working")
+            return True, lines
+        
+        lines.append("❌ Git - Not found")
+        lines.append("   Git is required for repository analysis")
+        lines.append("   Installation instructions:")
+        lines.extend(self.INSTALL_HINTS["git"].get(self.system, ()))
+        
+        return False, lines
+    
+    async def _check_tools(self):
+        """Probe Git, Gource and FFmpeg concurrently"""
+        if self.system != "windows":
+            # One sh process pays the spawn cost once; cmd.exe chaining would
+            # add a process rather than save one, so Windows spawns each tool
+            self._probe_results = await self._probe_all_unix()
+        
+        return await asyncio.gather(self._check_git_async(), self._check_gource_async(),
+                                    self._check_ffmpeg_async())
     
     def create_desktop_shortcut(self):
         """Create desktop shortcut (platform-specific)"""
         print("\n🖥️  Creating desktop shortcut...")
         
         main_py = self.project_dir / "main.py"
+        # Shared bytecode cache, so launches reuse .pyc files even if the
+        # project directory is read-only; -OO drops docstrings and asserts
+        pycache_dir = Path.home() / ".cache" / "gource-gui"
         
         try:
             if self.system == "darwin":
                 # macOS: Create .command file
-                shortcut_path = Path.home() / "Desktop" / "Gource GUI.command"
-                shortcut_content = f'''#!/bin/bash
-cd "{self.project_dir}"
-python3 "{main_py}"
-'''
-                shortcut_path.write_text(shortcut_content)
+                shortcut_path = Path.home() / "Desktop" / self.SHORTCUT_NAMES["darwin"]
+                shortcut_content = "\n".join([
+                    "#!/bin/bash",
+                    f'cd "{self.project_dir}"',
+                    f'export PYTHONPYCACHEPREFIX="{pycache_dir}"',
+                    f'python3 -OO "{main_py}"',
+                    "",
+                ])
+                shortcut_path.write_bytes(shortcut_content.encode("utf-8"))
                 os.chmod(shortcut_path, 0o755)
                 print(f"✅ Desktop shortcut created: {shortcut_path}")
                 
             elif self.system == "linux":
                 # Linux: Create .desktop file
-                shortcut_path = Path.home() / "Desktop" / "gource-gui.desktop"
-                shortcut_content = f'''[Desktop Entry]
-Version=1.0
-Type=Application
-Name=Gource GUI
-Comment=GUI for Gource version control visualization
-Exec=python3 "{main_py}"
-Icon=applications-multimedia
-Path={self.project_dir}
-Terminal=false
-StartupNotify=true
-Categories=Development;Graphics;
-'''
-                shortcut_path.write_text(shortcut_content)
+                shortcut_path = Path.home() / "Desktop" / self.SHORTCUT_NAMES["linux"]
+                shortcut_content = "\n".join([
+                    "[Desktop Entry]",
+                    "Version=1.0",
+                    "Type=Application",
+                    "Name=Gource GUI",
+                    "Comment=GUI for Gource version control visualization",
+                    f"Exec=env {_desktop_exec_arg(f'PYTHONPYCACHEPREFIX={pycache_dir}')} "
+                    f"python3 -OO {_desktop_exec_arg(str(main_py))}",
+                    "Icon=applications-multimedia",
+                    f"Path={self.project_dir}",
+                    "Terminal=false",
+                    "StartupNotify=true",
+                    "Categories=Development;Graphics;",
+                    "",
+                ])
+                shortcut_path.write_bytes(shortcut_content.encode("utf-8"))
                 os.chmod(shortcut_path, 0o755)
                 print(f"✅ Desktop shortcut created: {shortcut_path}")
                 
             elif self.system == "windows":
                 # Windows: Create .bat file
-                shortcut_path = Path.home() / "Desktop" / "Gource GUI.bat"
-                shortcut_content = f'''@echo off
-cd /d "{self.project_dir}"
-python "{main_py}"
-pause
-'''
-                shortcut_path.write_text(shortcut_content)
+                shortcut_path = Path.home() / "Desktop" / self.SHORTCUT_NAMES["windows"]
+                # Batch files want CRLF line endings, and cmd.exe reads them in the
+                # ANSI code page rather than UTF-8
+                shortcut_content = "\r\n".join([
+                    "@echo off",
+                    f'cd /d "{self.project_dir}"',
+                    f'set "PYTHONPYCACHEPREFIX={pycache_dir}"',
+                    f'python -OO "{main_py}"',
+                    "pause",
+                    "",
+                ])
+                shortcut_path.write_bytes(shortcut_content.encode(locale.getpreferredencoding(False)))
                 print(f"✅ Desktop shortcut created: {shortcut_path}")
                 
             return True
@@ -235,23 +370,30 @@ pause
             print("❌ main.py not found")
             return False
         
+        project_dir = str(self.project_dir)
+        if project_dir not in sys.path:
+            sys.path.insert(0, project_dir)
+        # Packages pip just installed aren't in the import system's directory caches yet
+        importlib.invalidate_caches()
+        
+        # Test import only (don't start GUI); importing here avoids starting
+        # a second interpreter just for this check
         try:
-            # Test import only (don't start GUI)
-            cmd = [sys.executable, "-c", "import sys; sys.path.insert(0, '.'); from gui.main_window_with_video import GourceGUIApp; print('✅ Application modules load successfully')"]
-            result = subprocess.run(cmd, cwd=self.project_dir, capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                print(result.stdout.strip())
-                return True
-            else:
-                print(f"❌ Application test failed: {result.stderr}")
+            # find_spec imports the parent package, which can fail too
+            if importlib.util.find_spec("gui.main_window_with_video") is None:
+                print("❌ Application test failed: gui.main_window_with_video not found")
                 return False
-        except subprocess.TimeoutExpired:
-            print("❌ Application test timed out")
-            return False
+            module = importlib.import_module("gui.main_window_with_video")
         except Exception as e:
-            print(f"❌ Application test error: {e}")
+            print(f"❌ Application test failed: {e}")
             return False
+        
+        if not hasattr(module, "GourceGUIApp"):
+            print("❌ Application test failed: GourceGUIApp not found")
+            return False
+        
+        print("✅ Application modules load successfully")
+        return True
     
     def print_usage_instructions(self):
         """Print instructions on how to use the application"""
@@ -264,12 +406,8 @@ pause
         print("   python3 main.py")
         
         print("\n2. Desktop Shortcut:")
-        if self.system == "darwin":
-            print("   Double-click 'Gource GUI.command' on your Desktop")
-        elif self.system == "linux":
-            print("   Double-click 'gource-gui.desktop' on your Desktop")
-        elif self.system == "windows":
-            print("   Double-click 'Gource GUI.bat' on your Desktop")
+        if self.system in self.SHORTCUT_NAMES:
+            print(f"   Double-click '{self.SHORTCUT_NAMES[self.system]}' on your Desktop")
         
         print("\n📖 Usage:")
         print("   1. Click 'Browse...' to select a Git repository")
@@ -301,14 +439,20 @@ pause
         if not self.check_tkinter():
             success = False
         
-        if not self.check_git():
+        # Tool probes run concurrently; print their output in the usual order
+        (git_ok, git_lines), (gource_ok, gource_lines), (_, ffmpeg_lines) = \
+            asyncio.run(self._check_tools())
+        
+        for line in git_lines + gource_lines + ffmpeg_lines:
+            print(line)
+        
+        if not git_ok:
             success = False
         
-        if not self.check_gource():
+        if not gource_ok:
             success = False
         
-        # Optional check
-        self.check_ffmpeg()
+        # FFmpeg is optional, so its result doesn't affect success
         
         if not success:
             print("\n❌ Installation cannot continue due to missing requirements.")
@@ -11,8 +11,6 @@ import traceback
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from gui.main_window_with_video import GourceGUIApp
-
 def main():
     """Main entry point for the application"""
     try:
@@ -21,16 +19,18 @@ def main():
         
         # Set application icon and basic properties
         root.title("Gource GUI")
-        root.geometry("900x700")
-        root.minsize(800, 600)
         
-        # Center window on screen
-        root.update_idletasks()
+        # Center window on screen; the screen size is known without a layout pass
         x = (root.winfo_screenwidth() // 2) - (900 // 2)
         y = (root.winfo_screenheight() // 2) - (700 // 2)
         root.geometry(f"900x700+{x}+{y}")
+        root.minsize(800, 600)
+        
+        # Paint the empty window before loading the rest of the GUI
+        root.update()
         
         # Create and run application
+        from gui.main_window_with_video import GourceGUIApp
         app = GourceGUIApp(root)
         root.mainloop()
         
@@ -1,16 +1,41 @@
 """Configuration management for Gource GUI"""
+import atexit
+import copy
 import json
+import mmap
 import os
+import threading
+from itertools import islice
 from typing import Dict, Any, List
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class ConfigManager:
     """Manages application configuration and user preferences"""
     
+    # Seconds to wait after a change before writing, so bursts of set() calls
+    # from the GUI end up as a single save
+    SAVE_DELAY = 0.5
+    # Config files larger than this (bytes) are parsed through mmap
+    MMAP_THRESHOLD = 4096
+    
     def __init__(self):
         self.config_dir = os.path.expanduser("~/.gource-gui")
         self.config_file = os.path.join(self.config_dir, "config.json")
         self.defaults = self._get_defaults()
+        # Dotted key -> value index for get(); rebuilt lazily after changes
+        self._flat = None
+        self._lock = threading.Lock()
+        self._save_timer = None
+        self._dirty = False
         self.config = self.load_config()
+        # The save timer is a daemon thread and dies with the process, so write
+        # any change it hasn't saved yet on the way out
+        atexit.register(self.close)
     
     def _get_defaults(self) -> Dict[str, Any]:
         """Get default configuration values"""
@@ -50,69 +75,131 @@ class ConfigManager:
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
+        self._flat = None
+        
         if not os.path.exists(self.config_file):
-            return self.defaults.copy()
+            return copy.deepcopy(self.defaults)
         
         try:
-            with open(self.config_file, 'r') as f:
-                loaded = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.config_file, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                        # Parse straight from the page cache instead of copying into bytes
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                                memoryview(mm) as view:
+                            loaded = orjson.loads(view)
+                    else:
+                        loaded = orjson.loads(f.read())
+            else:
+                with open(self.config_file, 'r') as f:
+                    loaded = json.load(f)
             
             # Merge with defaults to ensure all keys exist
-            config = self.defaults.copy()
+            config = copy.deepcopy(self.defaults)
             self._deep_update(config, loaded)
             return config
             
         except (json.JSONDecodeError, FileNotFoundError, PermissionError):
-            return self.defaults.copy()
+            return copy.deepcopy(self.defaults)
     
     def save_config(self) -> bool:
         """Save configuration to file"""
-        try:
-            os.makedirs(self.config_dir, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            return True
-        except (PermissionError, OSError):
-            return False
+        tmp_file = self.config_file + ".tmp"
+        
+        with self._lock:
+            self._dirty = False
+            try:
+                if ORJSON_AVAILABLE:
+                    data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self.config, indent=2).encode()
+                
+                # Write a temp file and swap it in, so a crash never leaves a partial config
+                os.makedirs(self.config_dir, exist_ok=True)
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
+                return True
+            except (PermissionError, OSError):
+                self._dirty = True
+                return False
+    
+    def _schedule_save(self) -> None:
+        """Save in the background once changes stop arriving"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self.save_config)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def close(self) -> None:
+        """Write any pending changes now (also registered to run at exit)"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        
+        if self._dirty:
+            self.save_config()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation"""
-        keys = key.split('.')
-        value = self.config
+        if self._flat is None:
+            self._flat = self._flatten(self.config)
+        return self._flat.get(key, default)
+    
+    def _flatten(self, config: Dict) -> Dict[str, Any]:
+        """Index every nested value by its dotted key"""
+        flat = {}
+        stack = [("", config)]
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        while stack:
+            prefix, node = stack.pop()
+            for k, value in node.items():
+                dotted = prefix + k
+                flat[dotted] = value
+                if isinstance(value, dict):
+                    stack.append((dotted + ".", value))
         
-        return value
+        return flat
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation"""
-        keys = key.split('.')
-        config = self.config
-        
-        for k in keys[:-1]:
-            if k not in config or not isinstance(config[k], dict):
-                config[k] = {}
-            config = config[k]
+        with self._lock:
+            config = self.config
+            k, sep, rest = key.partition('.')
+            while sep:
+                if k not in config or not isinstance(config[k], dict):
+                    config[k] = {}
+                config = config[k]
+                k, sep, rest = rest.partition('.')
+            
+            config[k] = value
+            flat = self._flat
+            if (flat is not None and not isinstance(value, dict)
+                    and key in flat and not isinstance(flat[key], dict)):
+                # Replacing an existing leaf leaves every other indexed path as
+                # it was, so update the index instead of rebuilding it
+                flat[key] = value
+            else:
+                self._flat = None
+            self._dirty = True
         
-        config[keys[-1]] = value
+        self._schedule_save()
     
     def add_recent_repository(self, repo_path: str) -> None:
         """Add repository to recent list"""
-        recent = self.config.get("recent_repositories", [])
-        
-        # Remove if already exists
-        if repo_path in recent:
-            recent.remove(repo_path)
-        
-        # Add to front
-        recent.insert(0, repo_path)
+        with self._lock:
+            recent = self.config.get("recent_repositories", [])
+            
+            # Put it at the front; dict keys keep the first occurrence, which
+            # drops the older entry in one pass. Keep only last 10
+            self.config["recent_repositories"] = list(
+                islice(dict.fromkeys([repo_path, *recent]), 10))
+            self._flat = None
+            self._dirty = True
         
-        # Keep only last 10
-        self.config["recent_repositories"] = recent[:10]
+        self._schedule_save()
     
     def get_recent_repositories(self) -> List[str]:
         """Get list of recent repositories"""
@@ -120,12 +207,21 @@ class ConfigManager:
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
-        self.config = self.defaults.copy()
+        with self._lock:
+            self.config = copy.deepcopy(self.defaults)
+            self._flat = None
+            self._dirty = True
+        
+        self._schedule_save()
     
     def _deep_update(self, base_dict: Dict, update_dict: Dict) -> None:
-        """Recursively update nested dictionary"""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        """Update nested dictionary in place, merging sub-dictionaries"""
+        stack = [(base_dict, update_dict)]
+        
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                if isinstance(value, dict) and isinstance(base.get(key), dict):
+                    stack.append((base[key], value))
+                else:
+                    base[key] = value